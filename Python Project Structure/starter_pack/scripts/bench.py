@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+"""Run benchmarks for PROJECT_NAME and check them against a baseline."""
+
+import argparse
+import importlib
+import json
+import math
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import timeit
+from pathlib import Path
+
+BENCH_DIR = Path("tests") / "benchmarks"
+RESULTS_DIR = Path(".benchmarks")
+
+
+def _git(*args):
+    result = subprocess.run(
+        ["git", *args], check=True, stdout=subprocess.PIPE, text=True
+    )
+    return result.stdout.strip()
+
+
+def _discover(pattern):
+    """Import every bench_*.py module and return the matching registry entries."""
+    sys.path[:0] = [str(Path("src").resolve()), os.getcwd()]
+    os.environ["PYTHONPATH"] = os.pathsep.join(
+        filter(None, [str(Path("src").resolve()), os.environ.get("PYTHONPATH")])
+    )
+    registry = importlib.import_module("tests.benchmarks").REGISTRY
+    for path in sorted(BENCH_DIR.glob("bench_*.py")):
+        importlib.import_module(f"tests.benchmarks.{path.stem}")
+    return {
+        name: spec
+        for name, spec in sorted(registry.items())
+        if pattern is None or pattern in name
+    }
+
+
+def _measure(spec, repeat=None):
+    """Run one benchmark and return per-call statistics in its unit."""
+    repeat = repeat or spec["repeat"]
+    if spec["unit"] == "bytes":
+        # Memory benchmarks measure themselves and return a byte count.
+        number = 1
+        samples = [spec["func"]() for _ in range(repeat)]
+    else:
+        timer = timeit.Timer(spec["func"])
+        number = spec["number"] or timer.autorange()[0]
+        if spec["warmup"]:
+            timer.repeat(repeat=spec["warmup"], number=number)
+        samples = [
+            t / number for t in timer.repeat(repeat=repeat, number=number)
+        ]
+    return {
+        "mean": statistics.fmean(samples),
+        "stdev": statistics.stdev(samples) if len(samples) > 1 else 0.0,
+        "median": statistics.median(samples),
+        "min": min(samples),
+        "number": number,
+        "samples": samples,
+        "unit": spec["unit"],
+    }
+
+
+def _format(value, unit="s"):
+    if unit == "bytes":
+        for suffix, scale in (("GiB", 2**30), ("MiB", 2**20), ("KiB", 2**10)):
+            if abs(value) >= scale:
+                return f"{value / scale:.2f}{suffix}"
+        return f"{value:.0f}B"
+    seconds = value
+    for unit, scale in (("s", 1), ("ms", 1e3), ("us", 1e6)):
+        if seconds * scale >= 1:
+            return f"{seconds * scale:.2f}{unit}"
+    return f"{seconds * 1e9:.0f}ns"
+
+
+def _compare(current, baseline, threshold, sigma):
+    """Return names of benchmarks that regressed against ``baseline``.
+
+    A benchmark regresses when its mean is more than ``threshold`` slower
+    (or larger, for memory benchmarks) and the difference exceeds ``sigma``
+    combined standard errors.
+    """
+    regressions = []
+    for name, new in current.items():
+        old = baseline.get(name)
+        if old is None:
+            continue
+        change = new["mean"] / old["mean"] - 1
+        stderr = math.sqrt(
+            new["stdev"] ** 2 / len(new["samples"])
+            + old["stdev"] ** 2 / len(old["samples"])
+        )
+        significant = new["mean"] - old["mean"] > sigma * stderr
+        regressed = change > threshold and significant
+        marker = "❌" if regressed else "  "
+        print(f"  {marker} {name:<40} {change:+7.1%}")
+        if regressed:
+            regressions.append(name)
+    return regressions
+
+
+def main():
+    """Run benchmarks, save results and gate on regressions."""
+    parser = argparse.ArgumentParser(description="Run benchmarks")
+    parser.add_argument("-k", dest="pattern", help="Only run benchmarks containing this")
+    parser.add_argument(
+        "--baseline", metavar="REF",
+        help="Compare against results saved for this git ref (default: baseline.json)",
+    )
+    parser.add_argument(
+        "--save-baseline", action="store_true",
+        help="Also store these results as .benchmarks/baseline.json",
+    )
+    parser.add_argument(
+        "--threshold", type=float, default=0.10,
+        help="Relative slowdown that counts as a regression (default: 0.10)",
+    )
+    parser.add_argument(
+        "--sigma", type=float, default=3.0,
+        help="Standard errors the slowdown must exceed (default: 3.0)",
+    )
+    parser.add_argument(
+        "--repeat", type=int,
+        help="Override the number of samples per benchmark (quick smoke runs)",
+    )
+    args = parser.parse_args()
+
+    commit = _git("rev-parse", "HEAD")
+    dirty = bool(_git("status", "--porcelain", "--", "src", "tests"))
+
+    benchmarks = _discover(args.pattern)
+    if not benchmarks:
+        print("❌ No benchmarks found")
+        return 1
+
+    print(f"⏱️  Running {len(benchmarks)} benchmarks at {commit[:10]}")
+    results = {}
+    for name, spec in benchmarks.items():
+        results[name] = _measure(spec, args.repeat)
+        stats = results[name]
+        print(
+            f"  {name:<40} {_format(stats['mean'], stats['unit']):>10} "
+            f"± {_format(stats['stdev'], stats['unit']):>9}  (x{stats['number']})"
+        )
+
+    RESULTS_DIR.mkdir(exist_ok=True)
+    output = RESULTS_DIR / f"{commit}{'-dirty' if dirty else ''}.json"
+    previous = json.loads(output.read_text())["benchmarks"] if output.exists() else {}
+    record = {
+        "commit": commit,
+        "dirty": dirty,
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "timestamp": time.time(),
+        "benchmarks": {**previous, **results},
+    }
+    output.write_text(json.dumps(record, indent=1))
+    print(f"\n💾 Results saved to {output}")
+
+    if args.baseline:
+        resolved = subprocess.run(
+            ["git", "rev-parse", "--verify", "--quiet", f"{args.baseline}^{{commit}}"],
+            stdout=subprocess.PIPE, text=True,
+        ).stdout.strip()
+        baseline_file = RESULTS_DIR / f"{resolved or args.baseline}.json"
+    else:
+        baseline_file = RESULTS_DIR / "baseline.json"
+
+    status = 0
+    if baseline_file.exists():
+        print(f"\n📊 Comparing against {baseline_file}")
+        baseline = json.loads(baseline_file.read_text())["benchmarks"]
+        regressions = _compare(results, baseline, args.threshold, args.sigma)
+        if regressions:
+            print(f"\n❌ {len(regressions)} benchmarks regressed")
+            status = 1
+        else:
+            print("\n✅ No regressions")
+    else:
+        print(f"\n⚠️  No baseline at {baseline_file}; skipping comparison")
+
+    if args.save_baseline:
+        (RESULTS_DIR / "baseline.json").write_text(output.read_text())
+        print("📌 Saved as baseline")
+
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,27 +2,142 @@
 """Run linting checks for PROJECT_NAME."""
 
 import argparse
+import hashlib
+import json
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+LINT_PATHS = ["src", "tests"]
+TYPE_PATHS = ["src"]
+CONFIG_FILES = ["pyproject.toml", "ruff.toml", ".ruff.toml", "mypy.ini", "setup.cfg"]
+CACHE_FILE = Path(".lint_cache") / "results.json"
+
+
+def _sha1(data):
+    return hashlib.sha1(data).hexdigest()
+
+
+def _python_files(paths):
+    """Return {path: content hash} for every .py file under ``paths``."""
+    return {
+        path.as_posix(): _sha1(path.read_bytes())
+        for root in paths
+        for path in sorted(Path(root).rglob("*.py"))
+    }
+
+
+def _config_hash(tool):
+    """Hash the tool version together with every config file it may read.
+
+    The version comes from ``tool --version`` so tools installed outside
+    this interpreter (pipx, uv tool, brew) still invalidate the cache.
+    """
+    try:
+        version = subprocess.run(
+            [tool, "--version"], stdout=subprocess.PIPE, text=True
+        ).stdout.strip()
+    except OSError:
+        version = "missing"
+    configs = b"".join(
+        Path(name).read_bytes() for name in CONFIG_FILES if Path(name).exists()
+    )
+    return _sha1(version.encode() + configs)
+
+
+def _load_cache():
+    try:
+        return json.loads(CACHE_FILE.read_text())
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_cache(cache):
+    CACHE_FILE.parent.mkdir(exist_ok=True)
+    CACHE_FILE.write_text(json.dumps(cache, indent=1, sort_keys=True))
+
+
+def _stale(cache, tool, config, files):
+    """Return the files whose last clean result for ``tool`` is out of date."""
+    entry = cache.get(tool, {})
+    clean = entry.get("files", {}) if entry.get("config") == config else {}
+    return [path for path, digest in files.items() if clean.get(path) != digest]
+
+
+def _run(name, cmd):
+    result = subprocess.run(
+        cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True
+    )
+    return name, result.returncode, result.stdout
 
 
 def main():
     """Run all linting checks."""
     parser = argparse.ArgumentParser(description="Run linting checks")
     parser.add_argument("--fix", action="store_true", help="Auto-fix issues")
+    parser.add_argument(
+        "--no-cache", action="store_true", help="Re-check every file"
+    )
+    parser.add_argument(
+        "--no-daemon", action="store_true", help="Use mypy instead of dmypy"
+    )
     args = parser.parse_args()
-    
-    print("🔍 Running ruff...")
-    cmd = ["ruff", "check", "src/", "tests/"]
+
     if args.fix:
-        cmd.append("--fix")
-    
-    result = subprocess.run(cmd)
-    
-    if result.returncode != 0:
+        # Fixing rewrites files, so it must finish before anything reads them.
+        print("🔧 Running ruff --fix...")
+        subprocess.run(["ruff", "check", "--fix", *LINT_PATHS])
+
+    cache = {} if args.no_cache else _load_cache()
+    lint_files = _python_files(LINT_PATHS)
+    type_files = _python_files(TYPE_PATHS)
+    ruff_config = _config_hash("ruff")
+    mypy_config = _config_hash("mypy")
+
+    mypy_cmd = ["mypy", *TYPE_PATHS]
+    if not args.no_daemon:
+        mypy_cmd = ["dmypy", "run", "--", *TYPE_PATHS]
+    checks = {
+        "ruff check": (["ruff", "check", "--force-exclude"], ruff_config, lint_files),
+        "ruff format": (
+            ["ruff", "format", "--check", "--force-exclude"], ruff_config, lint_files
+        ),
+        "mypy": (mypy_cmd, mypy_config, type_files),
+    }
+
+    jobs = {}
+    for name, (cmd, config, files) in checks.items():
+        stale = _stale(cache, name, config, files)
+        if not stale:
+            print(f"⏭️  {name}: {len(files)} files unchanged since last clean run")
+        elif name == "mypy":
+            # Types flow across modules, so mypy always checks the whole tree.
+            jobs[name] = cmd
+        else:
+            jobs[name] = [*cmd, *stale]
+
+    results = []
+    if jobs:
+        print(f"🔍 Running {', '.join(jobs)}...")
+        with ThreadPoolExecutor(len(jobs)) as pool:
+            results = list(pool.map(lambda job: _run(*job), jobs.items()))
+
+    failed = False
+    for name, returncode, output in results:
+        _, config, files = checks[name]
+        if returncode == 0:
+            print(f"✅ {name} passed")
+            cache[name] = {"config": config, "files": files}
+        else:
+            failed = True
+            print(f"❌ {name} failed\n{output.rstrip()}")
+    _save_cache(cache)
+
+    if failed:
         print("❌ Linting failed")
         return 1
-    
+
     print("✅ Linting passed!")
     return 0
 
@@ -0,0 +1,631 @@
+#!/usr/bin/env python3
+"""Publish the allowlisted public mirror of PROJECT_NAME.
+
+Replaces the clone + ``git filter-repo --paths-from-file`` round trip from
+private_to_public_clean_mirror_workflow.md with a single streaming pass:
+``git fast-export`` is filtered through a prefix trie compiled from
+``allowlist.txt`` and fed straight into ``git fast-import``. Marks are kept
+in the state directory, so later runs only export the commits made since
+the last publish instead of rewriting all of history.
+"""
+
+import argparse
+import contextlib
+import hashlib
+import json
+import os
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ALLOWLIST = "allowlist.txt"
+RENAMES = {b"public.gitignore": b".gitignore"}
+STATE_DIR = ".mirror"
+
+_ANY = "any"
+_DIR = "dir"
+_ESCAPES = {
+    b"a": b"\a",
+    b"b": b"\b",
+    b"f": b"\f",
+    b"n": b"\n",
+    b"r": b"\r",
+    b"t": b"\t",
+    b"v": b"\v",
+    b'"': b'"',
+    b"\\": b"\\",
+}
+
+
+class AllowlistTrie:
+    """Prefix trie over path components compiled from ``allowlist.txt``.
+
+    Matching follows ``git filter-repo --path``: ``README.md`` selects that
+    file (or a directory of that name), ``src/`` selects everything below
+    ``src``. Lookups are memoised because the same paths recur in almost
+    every commit.
+    """
+
+    _END = None
+
+    def __init__(self, entries):
+        self.root = {}
+        self._cache = {}
+        for entry in entries:
+            kind = _DIR if entry.endswith("/") else _ANY
+            node = self.root
+            for part in entry.strip("/").encode().split(b"/"):
+                node = node.setdefault(part, {})
+            if node.get(self._END) != _ANY:
+                node[self._END] = kind
+
+    def matches(self, path):
+        """Return True if ``path`` (bytes, unquoted) is allowlisted."""
+        try:
+            return self._cache[path]
+        except KeyError:
+            pass
+        parts = path.split(b"/")
+        node = self.root
+        result = False
+        for depth, part in enumerate(parts, 1):
+            node = node.get(part)
+            if node is None:
+                break
+            kind = node.get(self._END)
+            if kind == _ANY or (kind == _DIR and depth < len(parts)):
+                result = True
+                break
+        self._cache[path] = result
+        return result
+
+
+def load_allowlist(text):
+    """Parse allowlist text into a list of path prefixes."""
+    entries = []
+    for lineno, raw in enumerate(text.splitlines(), 1):
+        line = raw.strip()
+        if not line or line.startswith("#"):
+            continue
+        if line.startswith(("glob:", "regex:")) or "==>" in line:
+            raise ValueError(
+                f"{ALLOWLIST}:{lineno}: only plain path prefixes are supported"
+            )
+        entries.append(line)
+    return entries
+
+
+def _unquote(path):
+    """Decode a C-style quoted path as written by ``git fast-export``."""
+    if not path.startswith(b'"'):
+        return path
+    body = path[1:-1]
+    out = bytearray()
+    i = 0
+    while i < len(body):
+        if body[i : i + 1] != b"\\":
+            out.append(body[i])
+            i += 1
+            continue
+        escape = body[i + 1 : i + 2]
+        if escape in _ESCAPES:
+            out += _ESCAPES[escape]
+            i += 2
+        else:
+            out.append(int(body[i + 1 : i + 4], 8))
+            i += 4
+    return bytes(out)
+
+
+def _git(repo, *args, **kwargs):
+    """Run a git command in ``repo`` and return its stdout as text."""
+    result = subprocess.run(
+        ["git", "-C", str(repo), *args],
+        check=True,
+        stdout=subprocess.PIPE,
+        **kwargs,
+    )
+    return result.stdout.decode()
+
+
+class BlobReader:
+    """Fetch blob contents through a persistent ``git cat-file --batch``."""
+
+    def __init__(self, repo):
+        self.repo = repo
+        self.proc = subprocess.Popen(
+            ["git", "-C", str(repo), "cat-file", "--batch"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+        )
+
+    def read(self, sha):
+        self.proc.stdin.write(sha + b"\n")
+        self.proc.stdin.flush()
+        header = self.proc.stdout.readline().split()
+        if len(header) != 3 or header[1] != b"blob":
+            raise ValueError(f"unexpected object {sha.decode()}: {header!r}")
+        data = self.proc.stdout.read(int(header[2]))
+        self.proc.stdout.read(1)
+        return data
+
+    def tree(self, rev):
+        """Return the recursive ``ls-tree`` entries of ``rev`` as (info, path)."""
+        listing = subprocess.run(
+            ["git", "-C", str(self.repo), "ls-tree", "-r", "-z", "--full-tree", rev],
+            check=True,
+            stdout=subprocess.PIPE,
+        ).stdout
+        return [tuple(entry.split(b"\t", 1)) for entry in listing.split(b"\0") if entry]
+
+    def close(self):
+        self.proc.stdin.close()
+        self.proc.wait()
+
+
+class MirrorFilter:
+    """Rewrite a ``fast-export --no-data`` stream into the public history.
+
+    Commits that end up with no allowlisted changes are pruned, the same way
+    ``git filter-repo`` prunes them, and their marks are aliased to their
+    surviving parent. Merges with two distinct surviving parents are kept
+    even when one parent now contains the other. Commits whose parents all
+    pruned away become roots. Blob contents are fetched only for kept
+    paths, so internal files never reach the public object store.
+
+    The export must use ``--show-original-ids``: a merge whose first parent
+    pruned away is compared against its surviving parent by tree.
+    """
+
+    def __init__(self, trie, blobs, marks, next_mark, out):
+        self.trie = trie
+        self.blobs = blobs
+        self.marks = marks
+        self.next_mark = next_mark
+        self.out = out
+        self.blob_marks = {}
+        self.kept = 0
+        self.pruned = 0
+        self._pushback = None
+
+    def run(self, stream):
+        """Consume the whole export stream."""
+        self.stream = stream
+        while True:
+            line = self._readline()
+            if not line:
+                break
+            if line.startswith(b"commit "):
+                self._commit(line[7:-1])
+            elif line.startswith(b"reset "):
+                self._reset(line[6:-1])
+            elif line.startswith(b"tag "):
+                self._tag(line[4:-1])
+            elif line == b"\n" or line.startswith((b"progress ", b"feature ")):
+                continue
+            elif line == b"done\n":
+                break
+            else:
+                raise ValueError(f"unexpected fast-export line: {line!r}")
+
+    def _readline(self):
+        if self._pushback is not None:
+            line, self._pushback = self._pushback, None
+            return line
+        return self.stream.readline()
+
+    def _new_mark(self):
+        self.next_mark += 1
+        return f":{self.next_mark}"
+
+    def _resolve(self, ref):
+        if not ref.startswith(b":"):
+            raise ValueError(f"expected a mark reference, got {ref!r}")
+        try:
+            return self.marks[ref.decode()]
+        except KeyError:
+            raise ValueError(
+                f"{ref.decode()} is not a known commit (tags of tags are "
+                f"not supported)"
+            ) from None
+
+    def _public_tree(self, rev):
+        return sorted(
+            (info, path)
+            for info, path in self.blobs.tree(rev)
+            if self.trie.matches(path)
+        )
+
+    def _blob(self, sha):
+        mark = self.blob_marks.get(sha)
+        if mark is None:
+            data = self.blobs.read(sha)
+            mark = self.blob_marks[sha] = self._new_mark()
+            self.out.write(b"blob\nmark %s\ndata %d\n" % (mark.encode(), len(data)))
+            self.out.write(data)
+            self.out.write(b"\n")
+        return mark.encode()
+
+    def _filter_change(self, change):
+        if change.startswith(b"M "):
+            mode, ref, path = change[2:].split(b" ", 2)
+            real = _unquote(path)
+            if not self.trie.matches(real):
+                return None
+            if mode != b"160000":
+                ref = self._blob(ref)
+            return b"M %s %s %s" % (mode, ref, RENAMES.get(real, path))
+        if change.startswith(b"D "):
+            real = _unquote(change[2:])
+            if not self.trie.matches(real):
+                return None
+            return b"D " + RENAMES.get(real, change[2:])
+        if change == b"deleteall":
+            return change
+        raise ValueError(f"unsupported file change: {change!r}")
+
+    def _commit(self, ref):
+        mark = None
+        original = None
+        header = []
+        parents = []
+        changes = []
+        while True:
+            line = self._readline()
+            if line in (b"\n", b""):
+                break
+            if line.startswith(b"mark "):
+                mark = line[5:-1].decode()
+            elif line.startswith(b"data "):
+                header.append(line + self.stream.read(int(line[5:])))
+            elif line.startswith((b"from ", b"merge ")):
+                parents.append(line.split(b" ", 1)[1][:-1])
+            elif line.startswith((b"author ", b"committer ", b"encoding ")):
+                header.append(line)
+            elif line.startswith(b"original-oid "):
+                original = line[13:-1].decode()
+            else:
+                changes.append(line[:-1])
+
+        kept = [c for c in map(self._filter_change, changes) if c is not None]
+        resolved = []
+        for parent in map(self._resolve, parents):
+            if parent is not None and parent not in resolved:
+                resolved.append(parent)
+
+        first_pruned = bool(parents) and self._resolve(parents[0]) is None
+        if first_pruned and kept and len(resolved) == 1 and original is not None:
+            # A merge that keeps only a later parent becomes a plain commit
+            # of that parent; like filter-repo, drop it if the trees match.
+            index = [self._resolve(p) for p in parents].index(resolved[0])
+            if self._public_tree(original) == self._public_tree(
+                f"{original}^{index + 1}"
+            ):
+                kept = []
+
+        if not kept and len(resolved) <= 1:
+            alias = resolved[0] if resolved else None
+            self.marks[mark] = alias
+            self.pruned += 1
+            if alias is not None:
+                self.out.write(b"reset %s\nfrom %s\n\n" % (ref, alias.encode()))
+            return
+
+        if first_pruned and resolved:
+            # The original first parent had an empty public tree, so the
+            # change list already spells out every public file in full.
+            kept.insert(0, b"deleteall")
+
+        target = self.marks[mark] = self._new_mark()
+        self.kept += 1
+        if not resolved:
+            # Without a from line fast-import would continue the branch tip.
+            self.out.write(b"reset %s\n\n" % ref)
+        self.out.write(b"commit %s\nmark %s\n" % (ref, target.encode()))
+        self.out.writelines(header)
+        for i, parent in enumerate(resolved):
+            verb = b"from" if i == 0 else b"merge"
+            self.out.write(b"%s %s\n" % (verb, parent.encode()))
+        for change in kept:
+            self.out.write(change + b"\n")
+        self.out.write(b"\n")
+
+    def _reset(self, ref):
+        line = self._readline()
+        if not line.startswith(b"from "):
+            # A parentless reset starts a new root (orphan branches).
+            self._pushback = line
+            self.out.write(b"reset %s\n\n" % ref)
+            return
+        target = self._resolve(line[5:-1])
+        if target is not None:
+            self.out.write(b"reset %s\nfrom %s\n\n" % (ref, target.encode()))
+
+    def _tag(self, name):
+        lines = []
+        target = None
+        while True:
+            line = self._readline()
+            if not line:
+                raise ValueError(f"export stream ended inside tag {name.decode()!r}")
+            if line.startswith(b"from "):
+                target = self._resolve(line[5:-1])
+            elif line.startswith(b"data "):
+                lines.append(line + self.stream.read(int(line[5:])))
+                break
+            elif not line.startswith((b"mark ", b"original-oid ")):
+                lines.append(line)
+        if target is not None:
+            self.out.write(b"tag %s\nfrom %s\n" % (name, target.encode()))
+            self.out.writelines(lines)
+            self.out.write(b"\n")
+
+
+def _load_state(state_dir):
+    path = state_dir / "state.json"
+    if not path.exists():
+        return {"allowlist": None, "marks": {}, "next_mark": 0}
+    return json.loads(path.read_text())
+
+
+def _save_state(state_dir, state):
+    tmp = state_dir / "state.json.tmp"
+    tmp.write_text(json.dumps(state))
+    os.replace(tmp, state_dir / "state.json")
+
+
+def publish(source, state_dir, branches, tags=False, full=False, remote=None):
+    """Export new commits from ``source`` into the mirror in ``state_dir``.
+
+    Returns a dict of counters and per-phase timings.
+    """
+    source = Path(source).resolve()
+    state_dir = Path(state_dir).resolve()
+    started = time.perf_counter()
+
+    allowlist = _git(source, "show", f"{branches[0]}:{ALLOWLIST}")
+    digest = hashlib.sha256(allowlist.encode()).hexdigest()
+    trie = AllowlistTrie(load_allowlist(allowlist))
+
+    state = _load_state(state_dir)
+    if state["allowlist"] not in (None, digest) and not full:
+        raise RuntimeError(
+            f"{ALLOWLIST} changed since the last publish; rerun with --full"
+        )
+    if full and state_dir.exists():
+        shutil.rmtree(state_dir)
+        state = _load_state(state_dir)
+
+    target = state_dir / "public.git"
+    if not target.exists():
+        state_dir.mkdir(parents=True, exist_ok=True)
+        subprocess.run(
+            ["git", "init", "--quiet", "--bare", str(target)], check=True
+        )
+
+    source_marks = state_dir / "source.marks"
+    target_marks = state_dir / "target.marks"
+    export_cmd = [
+        "git", "-C", str(source), "fast-export", "--no-data",
+        "--show-original-ids", "--signed-tags=strip",
+        "--tag-of-filtered-object=rewrite",
+        f"--import-marks-if-exists={source_marks}",
+        f"--export-marks={source_marks}.tmp",
+    ]
+    refs = [f"refs/heads/{branch}" for branch in branches]
+    if tags:
+        refs.append("--tags")
+    import_cmd = [
+        "git", "-C", str(target), "fast-import", "--quiet", "--done",
+        f"--import-marks-if-exists={target_marks}",
+        f"--export-marks={target_marks}.tmp",
+    ]
+
+    exporter = subprocess.Popen(export_cmd + refs, stdout=subprocess.PIPE)
+    importer = subprocess.Popen(import_cmd, stdin=subprocess.PIPE)
+    blobs = BlobReader(source)
+    stream = MirrorFilter(
+        trie, blobs, state["marks"], state["next_mark"], importer.stdin
+    )
+    try:
+        stream.run(exporter.stdout)
+        # fast-import runs with --done, so it only commits the stream once
+        # fast-export is known to have finished cleanly.
+        if exporter.wait() != 0:
+            raise RuntimeError("fast-export failed; mirror state unchanged")
+        importer.stdin.write(b"done\n")
+    except BaseException:
+        # Kill fast-import before its stdin closes so a truncated stream is
+        # never committed, and reap fast-export.
+        for process in (importer, exporter):
+            process.kill()
+            process.wait()
+        raise
+    finally:
+        blobs.close()
+        exporter.stdout.close()
+        with contextlib.suppress(BrokenPipeError):
+            importer.stdin.close()
+    if importer.wait() != 0:
+        raise RuntimeError("fast-import failed; mirror state unchanged")
+
+    os.replace(f"{source_marks}.tmp", source_marks)
+    os.replace(f"{target_marks}.tmp", target_marks)
+    _save_state(
+        state_dir,
+        {"allowlist": digest, "marks": stream.marks, "next_mark": stream.next_mark},
+    )
+    exported = time.perf_counter()
+
+    if remote:
+        push = ["git", "-C", str(target), "push", "--quiet", remote, *refs]
+        subprocess.run(push, check=True)
+
+    return {
+        "kept": stream.kept,
+        "pruned": stream.pruned,
+        "blobs": len(stream.blob_marks),
+        "export_seconds": exported - started,
+        "push_seconds": time.perf_counter() - exported,
+    }
+
+
+def _synthetic_repo(path, files, commits, seed=0):
+    """Build a repo with ``files`` paths and ``commits`` commits via fast-import."""
+    rng = random.Random(seed)
+    subprocess.run(["git", "init", "--quiet", "-b", "main", str(path)], check=True)
+    proc = subprocess.Popen(
+        ["git", "-C", str(path), "fast-import", "--quiet"], stdin=subprocess.PIPE
+    )
+    roots = ["src/pkg", "tests/unit", "docs", "_internal/notes", "_internal/pm"]
+    paths = [f"{roots[i % len(roots)]}/d{i % 97}/f{i}.txt" for i in range(files)]
+
+    def write_commit(n, changes):
+        message = f"commit {n}\n".encode()
+        proc.stdin.write(
+            b"commit refs/heads/main\nmark :%d\n"
+            b"committer Bench <bench@example.com> %d +0000\n"
+            b"data %d\n%s" % (n, 1_600_000_000 + n, len(message), message)
+        )
+        if n > 1:
+            proc.stdin.write(b"from :%d\n" % (n - 1))
+        for name, body in changes:
+            proc.stdin.write(b"M 100644 inline %s\ndata %d\n%s\n" % (name, len(body), body))
+        proc.stdin.write(b"\n")
+
+    allowlist = Path(__file__).resolve().parent.parent / ALLOWLIST
+    initial = [
+        (ALLOWLIST.encode(), allowlist.read_bytes()),
+        (b"public.gitignore", b"__pycache__/\n"),
+    ]
+    initial += [(p.encode(), f"{p} v0\n".encode()) for p in paths]
+    write_commit(1, initial)
+    for n in range(2, commits + 1):
+        touched = rng.sample(paths, 3)
+        write_commit(n, [(p.encode(), f"{p} v{n}\n".encode()) for p in touched])
+    proc.stdin.close()
+    if proc.wait() != 0:
+        raise RuntimeError("failed to build synthetic repository")
+
+
+def _append_commits(path, count, seed=1):
+    """Add ``count`` small commits on top of the synthetic repo."""
+    rng = random.Random(seed)
+    _git(path, "reset", "--quiet", "--hard")
+    tracked = _git(path, "ls-files").splitlines()
+    for n in range(count):
+        name = rng.choice(tracked)
+        (path / name).write_text(f"{name} extra {n}\n")
+        _git(path, "commit", "--quiet", "-am", f"extra {n}")
+
+
+def _time_filter_repo(source, workdir):
+    """Time the documented clone --mirror + filter-repo publish."""
+    if shutil.which("git-filter-repo") is None:
+        return None
+    clone = workdir / "filter-repo.git"
+    shutil.rmtree(clone, ignore_errors=True)
+    allowlist = workdir / ALLOWLIST
+    allowlist.write_text(_git(source, "show", f"main:{ALLOWLIST}"))
+    started = time.perf_counter()
+    subprocess.run(
+        ["git", "clone", "--quiet", "--mirror", str(source), str(clone)], check=True
+    )
+    subprocess.run(
+        [
+            "git", "-C", str(clone), "filter-repo", "--force", "--quiet",
+            "--paths-from-file", str(allowlist),
+            "--path-rename", "public.gitignore:.gitignore",
+        ],
+        check=True,
+        stderr=subprocess.DEVNULL,
+    )
+    return time.perf_counter() - started
+
+
+def benchmark(files, commits, extra):
+    """Compare mirror.py against filter-repo on a synthetic repository."""
+    with tempfile.TemporaryDirectory() as tmp:
+        workdir = Path(tmp)
+        source = workdir / "private"
+        for role in ("AUTHOR", "COMMITTER"):
+            os.environ.setdefault(f"GIT_{role}_NAME", "Bench")
+            os.environ.setdefault(f"GIT_{role}_EMAIL", "bench@example.com")
+
+        print(f"🏗️  Building synthetic repo: {files} files, {commits} commits...")
+        _synthetic_repo(source, files, commits)
+
+        rows = []
+        state_dir = workdir / "state"
+        rows.append(("filter-repo (full)", _time_filter_repo(source, workdir)))
+        result = publish(source, state_dir, ["main"])
+        rows.append(("mirror.py (initial)", result["export_seconds"]))
+
+        _append_commits(source, extra)
+        rows.append((f"filter-repo (+{extra} commits)", _time_filter_repo(source, workdir)))
+        result = publish(source, state_dir, ["main"])
+        rows.append((f"mirror.py (+{extra} commits)", result["export_seconds"]))
+
+    print("\n📊 Results")
+    for label, seconds in rows:
+        shown = "skipped (git-filter-repo not installed)" if seconds is None else f"{seconds:8.2f}s"
+        print(f"  {label:<28} {shown}")
+    return 0
+
+
+def main():
+    """Publish the public mirror or run the benchmark."""
+    parser = argparse.ArgumentParser(description="Publish the public mirror")
+    sub = parser.add_subparsers(dest="command")
+
+    pub = sub.add_parser("publish", help="Export new commits to the mirror")
+    pub.add_argument("--source", default=".", help="Private repository path")
+    pub.add_argument("--state-dir", default=STATE_DIR, help="Mirror state directory")
+    pub.add_argument(
+        "--branch", action="append", help="Branch to publish (default: main)"
+    )
+    pub.add_argument("--tags", action="store_true", help="Also publish tags")
+    pub.add_argument("--full", action="store_true", help="Rebuild from scratch")
+    pub.add_argument("--push", metavar="REMOTE", help="Push the mirror to REMOTE")
+
+    bench = sub.add_parser("bench", help="Compare against git filter-repo")
+    bench.add_argument("--files", type=int, default=100_000)
+    bench.add_argument("--commits", type=int, default=10_000)
+    bench.add_argument("--extra", type=int, default=10, help="Commits per increment")
+
+    args = parser.parse_args()
+    if args.command == "bench":
+        return benchmark(args.files, args.commits, args.extra)
+    if args.command is None:
+        args = parser.parse_args(["publish"])
+
+    print("🪞 Publishing public mirror...")
+    try:
+        result = publish(
+            args.source,
+            args.state_dir,
+            args.branch or ["main"],
+            tags=args.tags,
+            full=args.full,
+            remote=args.push,
+        )
+    except (RuntimeError, ValueError, subprocess.CalledProcessError) as exc:
+        print(f"❌ Mirror failed: {exc}")
+        return 1
+
+    print(
+        f"✅ Mirror updated: {result['kept']} commits kept, "
+        f"{result['pruned']} pruned, {result['blobs']} blobs "
+        f"in {result['export_seconds']:.2f}s"
+    )
+    if args.push:
+        print(f"🚀 Pushed to {args.push} in {result['push_seconds']:.2f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
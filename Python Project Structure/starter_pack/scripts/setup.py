@@ -1,20 +1,296 @@
 #!/usr/bin/env python3
 """Setup development environment for PROJECT_NAME."""
 
+import argparse
+import contextlib
+import hashlib
+import json
+import os
+import platform
+import re
+import shutil
 import subprocess
 import sys
+import tempfile
+import time
 from pathlib import Path
 
+LOCK_FILE = Path("requirements.lock")
+VENV_LINK = Path(".venv")
+CACHE_DIR = Path(".envcache")
+KEEP_VENVS = 3
+MARKER = ".setup-complete"
+
+
+@contextlib.contextmanager
+def _phase(name, timings):
+    """Record the wall time of the enclosed block under ``name``."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings[name] = timings.get(name, 0.0) + time.perf_counter() - start
+
+
+def _sha256(text):
+    return hashlib.sha256(text.encode()).hexdigest()
+
+
+def _python_version():
+    """Return the version pinned in .python-version, or the running one."""
+    path = Path(".python-version")
+    if path.exists():
+        return path.read_text().strip()
+    return f"{sys.version_info.major}.{sys.version_info.minor}"
+
+
+def _build_requires():
+    """Read ``[build-system] requires`` from pyproject.toml."""
+    text = Path("pyproject.toml").read_text()
+    section = re.search(r"^\[build-system\](.*?)(?=^\[|\Z)", text, re.M | re.S)
+    body = section.group(1) if section else ""
+    match = re.search(r"requires\s*=\s*\[(.*?)\]", body, re.S)
+    return re.findall(r"[\"']([^\"']+)[\"']", match.group(1)) if match else []
+
+
+def _lock_header(pyproject_hash, version):
+    return (
+        "# Generated by `python scripts/setup.py --locked --upgrade`; do not edit.\n"
+        f"# pyproject-sha256: {pyproject_hash}\n"
+        f"# python-version: {version}\n"
+    )
+
+
+def _lock_is_current(pyproject_hash, version):
+    if not LOCK_FILE.exists():
+        return False
+    return LOCK_FILE.read_text().startswith(_lock_header(pyproject_hash, version))
+
+
+def _find_python(version):
+    """Return an interpreter for ``version`` (from .python-version).
+
+    Accepts ``3.12`` as well as pyenv-style ``3.12.4``; the running
+    interpreter is used when it matches, otherwise ``python3.12`` on PATH.
+    """
+    running = platform.python_version()
+    if running == version or running.startswith(f"{version}."):
+        return sys.executable
+    python = shutil.which("python" + ".".join(version.split(".")[:2]))
+    if python is None:
+        raise RuntimeError(f"Python {version} not found (see .python-version)")
+    return python
+
+
+def _resolve(uv, version):
+    """Resolve .[dev] plus build requirements to sorted ``name==version`` pins.
+
+    Resolution targets ``version`` rather than the running interpreter, so
+    markers such as ``python_version < "3.11"`` match the venv being built.
+    """
+    build = _build_requires()
+    if uv:
+        with tempfile.NamedTemporaryFile("w", suffix=".in", delete=False) as f:
+            f.write("\n".join(build) + "\n")
+        try:
+            output = subprocess.run(
+                [uv, "pip", "compile", "--quiet", "--no-header", "--extra", "dev",
+                 "--python-version", version, "pyproject.toml", f.name],
+                check=True, stdout=subprocess.PIPE, text=True,
+            ).stdout
+        finally:
+            os.unlink(f.name)
+        pins = [line.split("#")[0].strip() for line in output.splitlines()]
+    else:
+        report = subprocess.run(
+            [_find_python(version), "-m", "pip", "install", "--quiet", "--dry-run",
+             "--ignore-installed", "--report", "-", ".[dev]", *build],
+            check=True, stdout=subprocess.PIPE, text=True,
+        ).stdout
+        pins = [
+            f"{item['metadata']['name']}=={item['metadata']['version']}"
+            for item in json.loads(report)["install"]
+            if "dir_info" not in item.get("download_info", {})
+        ]
+    # Canonical names (PEP 503) so pip and uv produce byte-identical locks.
+    return sorted(
+        re.sub(r"[-_.]+", "-", name).lower() + "==" + pinned
+        for name, _, pinned in (
+            pin.partition("==") for pin in pins if pin and not pin.startswith("-")
+        )
+    )
+
+
+def _write_lock(pins, pyproject_hash, version):
+    LOCK_FILE.write_text(_lock_header(pyproject_hash, version) + "\n".join(pins) + "\n")
+
+
+def _venv_python(venv):
+    if os.name == "nt":
+        return venv / "Scripts" / "python.exe"
+    return venv / "bin" / "python"
+
+
+def _create_venv(uv, venv, version):
+    if uv:
+        subprocess.run(
+            [uv, "venv", "--quiet", "--python", version, str(venv)], check=True
+        )
+        return
+    subprocess.run([_find_python(version), "-m", "venv", str(venv)], check=True)
+
+
+def _install(uv, venv, wheels, offline, timings):
+    """Install the lockfile, then the project itself, into ``venv``."""
+    python = str(_venv_python(venv))
+    project = ["--no-deps", "--no-build-isolation", "-e", "."]
+    if uv:
+        # uv keeps its own wheel cache, which --offline reads from.
+        flags = ["--python", python, "--find-links", str(wheels)]
+        flags += ["--offline"] if offline else []
+        with _phase("install", timings):
+            subprocess.run(
+                [uv, "pip", "sync", "--quiet", *flags, str(LOCK_FILE)], check=True
+            )
+            subprocess.run(
+                [uv, "pip", "install", "--quiet", *flags, *project], check=True
+            )
+        return
+
+    pip = [python, "-m", "pip", "--disable-pip-version-check", "--quiet"]
+    if not offline:
+        # Keep a local wheelhouse so later --offline runs can rebuild the venv.
+        with _phase("download", timings):
+            subprocess.run(
+                [*pip, "wheel", "--no-deps", "--find-links", str(wheels),
+                 "-w", str(wheels), "-r", str(LOCK_FILE)],
+                check=True,
+            )
+    flags = ["--no-index", "--find-links", str(wheels)]
+    with _phase("install", timings):
+        subprocess.run(
+            [*pip, "install", "--no-deps", *flags, "-r", str(LOCK_FILE)], check=True
+        )
+        subprocess.run([*pip, "install", *flags, *project], check=True)
+
+
+def _link(venv):
+    """Point .venv at ``venv``, refusing to replace a real directory."""
+    if VENV_LINK.is_symlink():
+        if Path(os.readlink(VENV_LINK)) == venv.resolve():
+            return
+        VENV_LINK.unlink()
+    elif VENV_LINK.exists():
+        raise RuntimeError(f"{VENV_LINK} is not a symlink; move it out of the way")
+    VENV_LINK.symlink_to(venv.resolve(), target_is_directory=True)
+
+
+def _prune(venvs, keep):
+    """Delete all but the ``KEEP_VENVS`` most recently used cached venvs."""
+    cached = sorted(
+        (path for path in venvs.iterdir() if path.is_dir() and path != keep),
+        key=lambda path: path.stat().st_mtime,
+        reverse=True,
+    )
+    for path in cached[KEEP_VENVS - 1 :]:
+        shutil.rmtree(path, ignore_errors=True)
+
+
+def locked(args):
+    """Build or reuse a cached venv for the current lockfile."""
+    timings = {}
+    uv = None if args.no_uv else shutil.which("uv")
+    mode = " (offline)" if args.offline else ""
+    print(f"📦 Installer: {'uv' if uv else 'pip'}{mode}")
+
+    with _phase("lock", timings):
+        pyproject_hash = _sha256(Path("pyproject.toml").read_text())
+        version = _python_version()
+        if args.upgrade or not _lock_is_current(pyproject_hash, version):
+            if args.offline:
+                if not LOCK_FILE.exists():
+                    print(f"❌ {LOCK_FILE} missing and cannot resolve offline")
+                    return 1
+                print(f"⚠️  {LOCK_FILE} is out of date; using it anyway")
+            else:
+                print(f"🔒 Resolving dependencies into {LOCK_FILE}...")
+                _write_lock(_resolve(uv, version), pyproject_hash, version)
+        # Only the pins matter; a header-only change must not rebuild the venv.
+        pins = [
+            line for line in LOCK_FILE.read_text().splitlines()
+            if line and not line.startswith("#")
+        ]
+        key = _sha256("\n".join([*pins, version]))[:16]
+
+    venvs = args.cache_dir / "venvs"
+    wheels = args.cache_dir / "wheels"
+    venv = venvs / f"py{version}-{key}"
+    marker = venv / MARKER
+
+    if marker.exists():
+        print(f"✅ Cached environment {venv.name} is up to date; skipping install")
+    else:
+        print(f"🔧 Building environment {venv.name}...")
+        shutil.rmtree(venv, ignore_errors=True)
+        venvs.mkdir(parents=True, exist_ok=True)
+        wheels.mkdir(parents=True, exist_ok=True)
+        with _phase("venv", timings):
+            _create_venv(uv, venv, version)
+        _install(uv, venv, wheels, args.offline, timings)
+        marker.write_text(key + "\n")
+
+    with _phase("link", timings):
+        _link(venv)
+        os.utime(venv)
+        _prune(venvs, venv)
+
+    print("\n⏱️  Time per phase:")
+    for name, seconds in timings.items():
+        print(f"  {name:<10} {seconds:7.2f}s")
+    print(f"  {'total':<10} {sum(timings.values()):7.2f}s")
+    print("\n✅ Development environment ready!")
+    print(f"\nActivate it with: source {VENV_LINK}/bin/activate")
+    return 0
+
 
 def main():
     """Setup development environment."""
+    parser = argparse.ArgumentParser(description="Setup development environment")
+    parser.add_argument(
+        "--locked", action="store_true",
+        help=f"Install {LOCK_FILE} into a cached venv linked at {VENV_LINK}",
+    )
+    parser.add_argument(
+        "--upgrade", action="store_true",
+        help="Re-resolve the lockfile even if pyproject.toml is unchanged",
+    )
+    parser.add_argument(
+        "--offline", action="store_true",
+        help="Do not use the network; install from the local wheel cache",
+    )
+    parser.add_argument(
+        "--no-uv", action="store_true", help="Use pip even if uv is available"
+    )
+    parser.add_argument(
+        "--cache-dir", type=Path, default=CACHE_DIR,
+        help=f"Where cached venvs and wheels live (default: {CACHE_DIR})",
+    )
+    args = parser.parse_args()
+
     print("🔧 Setting up development environment for PROJECT_NAME...")
-    
+
     # Check Python version
     if sys.version_info < (3, 9):
         print("❌ Python 3.9+ required")
         return 1
-    
+
+    if args.locked:
+        try:
+            return locked(args)
+        except (subprocess.CalledProcessError, RuntimeError) as e:
+            print(f"❌ Failed to set up locked environment: {e}")
+            return 1
+
     # Install dependencies
     print("\n📦 Installing dependencies...")
     try:
@@ -25,13 +301,13 @@ def main():
     except subprocess.CalledProcessError:
         print("❌ Failed to install dependencies")
         return 1
-    
+
     print("\n✅ Development environment ready!")
     print("\nNext steps:")
     print("  - Run tests: pytest")
     print("  - Run linting: ruff check src/")
     print("  - Start coding!")
-    
+
     return 0
 
 
@@ -2,8 +2,455 @@
 """Run test suite for PROJECT_NAME."""
 
 import argparse
+import ast
+import ctypes
+import ctypes.util
+import hashlib
+import heapq
+import importlib
+import json
+import os
+import select
+import struct
 import subprocess
 import sys
+import tempfile
+import time
+import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+SRC_DIR = Path("src")
+TESTS_DIR = Path("tests")
+E2E_DIR = TESTS_DIR / "e2e"
+DOC_SUFFIXES = (".md", ".rst")
+DURATIONS_FILE = Path(".pytest_cache") / "test_durations.json"
+INDEX_FILE = Path(".pytest_cache") / "import_index.json"
+WATCH_DEBOUNCE = 0.05
+POLL_INTERVAL = 0.3
+
+
+def _test_files():
+    """Return test modules under tests/ using pytest's default file patterns."""
+    files = set(TESTS_DIR.rglob("test_*.py")) | set(TESTS_DIR.rglob("*_test.py"))
+    return sorted(path.as_posix() for path in files)
+
+
+def _load_cache(path):
+    """Load a JSON cache written by an earlier run, or {} if unusable."""
+    try:
+        return json.loads(path.read_text())
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_cache(path, data):
+    path.parent.mkdir(exist_ok=True)
+    path.write_text(json.dumps(data, indent=1, sort_keys=True))
+
+
+def _module_name(path):
+    """Return the dotted module name of a file under src/ or tests/."""
+    parts = list(Path(path).with_suffix("").parts)
+    if parts[0] == SRC_DIR.name:
+        parts = parts[1:]
+    if parts[-1] == "__init__":
+        parts = parts[:-1]
+    return ".".join(parts)
+
+
+def _imports(source, module, is_package):
+    """Return every module name ``source`` may import, parents included."""
+    try:
+        tree = ast.parse(source)
+    except SyntaxError:
+        return []
+    package = module if is_package else module.rpartition(".")[0]
+    names = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            names.update(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom):
+            base = node.module or ""
+            if node.level:
+                parts = package.split(".")
+                parent = parts[: len(parts) - node.level + 1]
+                base = ".".join(part for part in [*parent, base] if part)
+            names.add(base)
+            names.update(f"{base}.{alias.name}" for alias in node.names)
+    expanded = set()
+    for name in names:
+        parts = name.split(".")
+        expanded.update(".".join(parts[:i]) for i in range(1, len(parts) + 1))
+    return sorted(expanded - {""})
+
+
+def _update_index():
+    """Refresh the persisted import index for src/ and tests/.
+
+    Files whose mtime and size are unchanged are not read at all; files
+    whose content hash is unchanged are not re-parsed.
+    """
+    index = _load_cache(INDEX_FILE)
+    fresh = {}
+    for path in sorted([*SRC_DIR.rglob("*.py"), *TESTS_DIR.rglob("*.py")]):
+        key = path.as_posix()
+        stat = path.stat()
+        entry = index.get(key)
+        if entry and (entry["mtime"], entry["size"]) == (stat.st_mtime, stat.st_size):
+            fresh[key] = entry
+            continue
+        source = path.read_bytes()
+        digest = hashlib.sha1(source).hexdigest()
+        if not entry or entry["sha1"] != digest:
+            is_package = path.name == "__init__.py"
+            imports = _imports(source, _module_name(path), is_package)
+            entry = {"sha1": digest, "imports": imports}
+        fresh[key] = {**entry, "mtime": stat.st_mtime, "size": stat.st_size}
+    _save_cache(INDEX_FILE, fresh)
+    return fresh
+
+
+def _changed_since(ref):
+    """Return paths changed since ``ref``, including untracked files."""
+    changed = subprocess.run(
+        ["git", "diff", "--name-only", "--relative", ref],
+        check=True, stdout=subprocess.PIPE, text=True,
+    ).stdout.splitlines()
+    changed += subprocess.run(
+        ["git", "ls-files", "--others", "--exclude-standard", "src", "tests"],
+        check=True, stdout=subprocess.PIPE, text=True,
+    ).stdout.splitlines()
+    return changed
+
+
+def _reachable(paths, index):
+    """Return ``paths`` plus every indexed file that imports them, transitively."""
+    dependents = {}
+    for path, entry in index.items():
+        for name in entry["imports"]:
+            dependents.setdefault(name, set()).add(path)
+
+    queue = list(paths)
+    seen = set(queue)
+    while queue:
+        path = queue.pop()
+        users = set(dependents.get(_module_name(path), ()))
+        if path.endswith("/conftest.py"):
+            folder = path.rpartition("/")[0] + "/"
+            users.update(other for other in index if other.startswith(folder))
+        queue.extend(users - seen)
+        seen |= users
+    return seen
+
+
+def _affected_tests(changed):
+    """Return test files affected by the ``changed`` paths.
+
+    Returns None when a change cannot be traced through imports (config,
+    scripts or data files), meaning the whole suite should run. Documentation
+    changes select nothing, and end-to-end tests under tests/e2e/ exercise
+    the CLI as a subprocess, so they always run.
+    """
+    sources = []
+    for path in changed:
+        if not path.startswith((f"{SRC_DIR}/", f"{TESTS_DIR}/")):
+            if not path.endswith(DOC_SUFFIXES):
+                return None
+        elif not path.endswith(".py"):
+            return None
+        else:
+            sources.append(path)
+    reachable = _reachable(sources, _update_index())
+    tests = _test_files()
+    e2e = {path for path in tests if path.startswith(f"{E2E_DIR.as_posix()}/")}
+    return sorted((reachable | e2e).intersection(tests))
+
+
+def _balance(files, durations, jobs):
+    """Split test files into ``jobs`` shards of similar expected runtime.
+
+    Files are weighted by the sum of their recorded test durations; files
+    with no history get the mean weight so new tests still spread out.
+    Uses longest-processing-time-first greedy assignment.
+    """
+    weights = dict.fromkeys(files)
+    for nodeid, seconds in durations.items():
+        path = nodeid.split("::", 1)[0]
+        if path in weights:
+            weights[path] = (weights[path] or 0.0) + seconds
+    known = [w for w in weights.values() if w is not None]
+    default = sum(known) / len(known) if known else 1.0
+    for path, weight in weights.items():
+        if weight is None:
+            weights[path] = default
+
+    shards = [(0.0, i, []) for i in range(min(jobs, len(files)))]
+    for path in sorted(files, key=weights.__getitem__, reverse=True):
+        load, i, members = heapq.heappop(shards)
+        members.append(path)
+        heapq.heappush(shards, (load + weights[path], i, members))
+    return [members for _, _, members in sorted(shards, key=lambda s: s[1])]
+
+
+def _junit_nodeid(testcase, files):
+    """Map a JUnit <testcase> back to its pytest node id."""
+    classname = testcase.get("classname", "")
+    parts = classname.split(".")
+    for i in range(len(parts), 0, -1):
+        path = "/".join(parts[:i]) + ".py"
+        if path in files:
+            return "::".join([path, *parts[i:], testcase.get("name", "")])
+    return None
+
+
+def _short_summary(output):
+    """Return the short test summary section (without the totals line)."""
+    start = output.find("short test summary info")
+    if start == -1:
+        return ""
+    section = output[output.rfind("\n", 0, start) + 1 :].rstrip("\n")
+    return section.rsplit("\n", 1)[0]
+
+
+def _run_shard(index, files, base_cmd, workdir, coverage):
+    """Run one shard of the suite and return (exit code, output, junit path)."""
+    junit = workdir / f"shard-{index}.xml"
+    cmd = [*base_cmd, "-p", "no:cacheprovider", f"--junitxml={junit}", *files]
+    env = dict(os.environ)
+    if coverage:
+        # Thresholds only make sense for the combined data, not per shard.
+        cmd.extend(["--cov=src", "--cov-report=", "--cov-fail-under=0"])
+        env["COVERAGE_FILE"] = f".coverage.shard{index}"
+    result = subprocess.run(
+        cmd, env=env, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True
+    )
+    return result.returncode, result.stdout, junit
+
+
+def run_sharded(args, base_cmd, files=None):
+    """Run the suite (or just ``files``) across ``args.jobs`` pytest processes."""
+    files = files or _test_files()
+    if not files:
+        print("✅ No test files to run")
+        return 0
+    durations = _load_cache(DURATIONS_FILE)
+    shards = _balance(files, durations, args.jobs)
+    print(f"🧪 Running {len(files)} test files in {len(shards)} shards")
+
+    with tempfile.TemporaryDirectory() as tmp, ThreadPoolExecutor(len(shards)) as pool:
+        futures = [
+            pool.submit(_run_shard, i, shard, base_cmd, Path(tmp), args.coverage)
+            for i, shard in enumerate(shards)
+        ]
+        results = [future.result() for future in futures]
+
+        totals = {"tests": 0, "failures": 0, "errors": 0, "skipped": 0}
+        known = set(_test_files())
+        durations = {
+            nodeid: seconds
+            for nodeid, seconds in durations.items()
+            if nodeid.split("::", 1)[0] in known
+        }
+        failed = False
+        for i, (code, output, junit) in enumerate(results):
+            # Exit code 5 means every test in the shard was deselected.
+            if code not in (0, 5):
+                failed = True
+                print(f"\n---- shard {i} (exit {code}) ----\n{output}")
+            elif _short_summary(output):
+                # Passing shards still report their skips and xfails (-ra).
+                print(f"\n---- shard {i} ----\n{_short_summary(output)}")
+            if not junit.exists():
+                continue
+            for suite in ET.parse(junit).getroot().iter("testsuite"):
+                for key in totals:
+                    totals[key] += int(suite.get(key, 0))
+                for case in suite.iter("testcase"):
+                    nodeid = _junit_nodeid(case, known)
+                    if nodeid is not None:
+                        durations[nodeid] = float(case.get("time", 0))
+
+    _save_cache(DURATIONS_FILE, durations)
+    print(
+        f"📋 {totals['tests']} tests: {totals['failures']} failed, "
+        f"{totals['errors']} errors, {totals['skipped']} skipped"
+    )
+
+    if args.coverage:
+        shard_data = [f".coverage.shard{i}" for i in range(len(shards))]
+        subprocess.run([sys.executable, "-m", "coverage", "combine", *shard_data])
+        subprocess.run([sys.executable, "-m", "coverage", "html"])
+        report = subprocess.run([sys.executable, "-m", "coverage", "report"])
+        failed = failed or report.returncode != 0
+
+    return 1 if failed else 0
+
+
+class _InotifyWatcher:
+    """Report saved .py files under the given roots using Linux inotify."""
+
+    # IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+    _MASK = 0x008 | 0x040 | 0x080 | 0x100 | 0x200
+    _IN_ISDIR = 0x40000000
+    _EVENT = struct.Struct("iIII")
+
+    def __init__(self, roots):
+        self._libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        self.fd = self._libc.inotify_init1(os.O_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self.dirs = {}
+        for root in roots:
+            for dirpath, _, _ in os.walk(root):
+                self._add(dirpath)
+
+    def _add(self, path):
+        wd = self._libc.inotify_add_watch(self.fd, os.fsencode(path), self._MASK)
+        if wd >= 0:
+            self.dirs[wd] = path
+
+    def wait(self):
+        """Block until files change, then return their paths."""
+        changed = set()
+        timeout = None
+        while True:
+            ready, _, _ = select.select([self.fd], [], [], timeout)
+            if not ready:
+                return changed
+            data = os.read(self.fd, 64 * 1024)
+            offset = 0
+            while offset < len(data):
+                wd, mask, _, size = self._EVENT.unpack_from(data, offset)
+                offset += self._EVENT.size
+                name = os.fsdecode(data[offset : offset + size].rstrip(b"\0"))
+                offset += size
+                path = os.path.join(self.dirs.get(wd, ""), name)
+                if mask & self._IN_ISDIR:
+                    if mask & 0x100:
+                        self._add(path)
+                elif name.endswith(".py"):
+                    changed.add(Path(path).as_posix())
+            if changed:
+                timeout = WATCH_DEBOUNCE
+
+
+class _PollingWatcher:
+    """Portable fallback that compares .py mtimes every POLL_INTERVAL."""
+
+    def __init__(self, roots):
+        self.roots = roots
+        self.snapshot = self._scan()
+
+    def _scan(self):
+        return {
+            path.as_posix(): path.stat().st_mtime_ns
+            for root in self.roots
+            for path in Path(root).rglob("*.py")
+        }
+
+    def wait(self):
+        """Block until files change, then return their paths."""
+        while True:
+            time.sleep(POLL_INTERVAL)
+            current = self._scan()
+            changed = {
+                path
+                for path in current.keys() | self.snapshot.keys()
+                if current.get(path) != self.snapshot.get(path)
+            }
+            self.snapshot = current
+            if changed:
+                return changed
+
+
+def _warm_import(paths):
+    """Import the src/ modules behind ``paths`` so forked workers inherit them.
+
+    conftest.py files are left to pytest, which imports them through its
+    assertion-rewriting hook.
+    """
+    for path in sorted(paths):
+        if path.startswith(f"{SRC_DIR}/"):
+            try:
+                importlib.import_module(_module_name(path))
+            except Exception:  # noqa: BLE001 - the worker will report it
+                pass
+
+
+def _run_worker(pytest_args):
+    """Run pytest in a forked copy of the warm process and return its exit code."""
+    if not hasattr(os, "fork"):
+        return subprocess.run(["pytest", *pytest_args]).returncode
+    sys.stdout.flush()
+    pid = os.fork()
+    if pid == 0:
+        import pytest
+
+        code = 1
+        try:
+            code = pytest.main(pytest_args)
+        finally:
+            sys.stdout.flush()
+            os._exit(int(code))
+    _, status = os.waitpid(pid, 0)
+    return os.waitstatus_to_exitcode(status)
+
+
+def watch(base_args):
+    """Re-run affected tests from a warm, pre-imported process on every save."""
+    from importlib import metadata
+
+    started = time.perf_counter()
+    import pytest  # noqa: F401 - imported once here, inherited by every worker
+
+    entry_points = metadata.entry_points()
+    if hasattr(entry_points, "select"):
+        plugins = entry_points.select(group="pytest11")
+    else:
+        plugins = entry_points.get("pytest11", [])
+    for plugin in plugins:
+        try:
+            plugin.load()
+        except Exception:  # noqa: BLE001 - pytest reports broken plugins itself
+            pass
+
+    sys.path[:0] = [str(SRC_DIR.resolve()), os.getcwd()]
+    index = _update_index()
+    _warm_import(index)
+
+    roots = [str(SRC_DIR), str(TESTS_DIR)]
+    try:
+        watcher = _InotifyWatcher(roots)
+        mode = "inotify"
+    except (OSError, AttributeError, TypeError):
+        watcher = _PollingWatcher(roots)
+        mode = "polling"
+    print(
+        f"👀 Watching src/ and tests/ ({mode}), warm in "
+        f"{time.perf_counter() - started:.2f}s. Ctrl+C to stop."
+    )
+
+    try:
+        while True:
+            changed = watcher.wait()
+            started = time.perf_counter()
+            index = _update_index()
+            stale = _reachable(changed, index)
+            for path in stale:
+                sys.modules.pop(_module_name(path), None)
+            _warm_import(stale & index.keys())
+
+            files = sorted(stale.intersection(_test_files()))
+            if not files:
+                print(f"💤 No tests affected by {', '.join(sorted(changed))}")
+                continue
+            returncode = _run_worker([*base_args, *files])
+            status = "✅ Tests passed" if returncode in (0, 5) else "❌ Tests failed"
+            print(f"{status} in {time.perf_counter() - started:.2f}s\n")
+    except KeyboardInterrupt:
+        print("\n👋 Stopped watching")
+        return 0
 
 
 def main():
@@ -11,7 +458,18 @@ def main():
     parser = argparse.ArgumentParser(description="Run test suite")
     parser.add_argument("--fast", action="store_true", help="Skip slow tests")
     parser.add_argument("--coverage", action="store_true", help="Generate coverage report")
-    parser.add_argument("--watch", action="store_true", help="Watch mode (not implemented)")
+    parser.add_argument(
+        "--watch", action="store_true",
+        help="Re-run affected tests whenever a file is saved",
+    )
+    parser.add_argument(
+        "--changed", nargs="?", const="HEAD", metavar="REF",
+        help="Only run tests affected by changes since REF (default: HEAD)",
+    )
+    parser.add_argument(
+        "--jobs", "-j", type=int, default=1, metavar="N",
+        help="Split the suite across N pytest processes",
+    )
     args = parser.parse_args()
     
     cmd = ["pytest", "-v"]
@@ -19,13 +477,33 @@ def main():
     if args.fast:
         cmd.extend(["-m", "not slow"])
     
-    if args.coverage:
-        cmd.extend(["--cov=src", "--cov-report=term", "--cov-report=html"])
+    if args.watch:
+        if args.coverage or args.changed or args.jobs > 1:
+            parser.error(
+                "--watch cannot be combined with --coverage, --changed or --jobs"
+            )
+        return watch(cmd[1:])
+    
+    files = None
+    if args.changed:
+        files = _affected_tests(_changed_since(args.changed))
+        if files == []:
+            print(f"✅ No tests affected by changes since {args.changed}")
+            return 0
+        if files is not None:
+            print(f"🎯 {len(files)} test files affected since {args.changed}")
+    
+    if args.jobs > 1:
+        returncode = run_sharded(args, ["pytest", "-q", *cmd[2:]], files)
+    else:
+        if args.coverage:
+            cmd.extend(["--cov=src", "--cov-report=term", "--cov-report=html"])
+        cmd.extend(files or [])
     
-    print(f"🧪 Running tests: {' '.join(cmd)}")
-    result = subprocess.run(cmd)
+        print(f"🧪 Running tests: {' '.join(cmd)}")
+        returncode = subprocess.run(cmd).returncode
     
-    if result.returncode != 0:
+    if returncode != 0:
         print("❌ Tests failed")
         return 1
     
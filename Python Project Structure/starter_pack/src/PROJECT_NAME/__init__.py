@@ -1,10 +1,26 @@
 """PROJECT_DISPLAY_NAME - Short description."""
 
+from typing import TYPE_CHECKING
+
+from PROJECT_NAME._lazy import attach
+
 __version__ = "0.1.0"
 __author__ = "Your Name"
 __email__ = "your.email@example.com"
 
+# Lazy exports: public name -> module defining it, imported on first access.
+# Example: "Client": "PROJECT_NAME.core.client"
+_EXPORTS: dict[str, str] = {}
+
+if TYPE_CHECKING:
+    # Real imports of every _EXPORTS entry, for type checkers and tooling.
+    # Example: from PROJECT_NAME.core.client import Client as Client
+    ...
+else:
+    __getattr__, __dir__ = attach(__name__, _EXPORTS)
+
 # Public API exports
 __all__ = [
     "__version__",
+    *_EXPORTS,
 ]
@@ -1,17 +1,67 @@
 """CLI entry point for PROJECT_NAME."""
 
+import argparse
 import sys
+from typing import Callable, Optional
 
 
-def main() -> int:
+def _parse_args(argv: Optional[list[str]]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="PROJECT_NAME")
+    parser.add_argument(
+        "--profile",
+        metavar="FILE",
+        help="Write cProfile stats to FILE (inspect with python -m pstats)",
+    )
+    parser.add_argument(
+        "--trace-out",
+        metavar="FILE",
+        help="Write a Chrome trace JSON of instrumented spans to FILE",
+    )
+    return parser.parse_args(argv)
+
+
+def _run() -> int:
+    print("PROJECT_DISPLAY_NAME v0.1.0")
+    print("CLI functionality not implemented yet.")
+    return 0
+
+
+def main(argv: Optional[list[str]] = None) -> int:
     """Main CLI entry point.
-    
+
+    Args:
+        argv: Command-line arguments (defaults to sys.argv[1:])
+
     Returns:
         Exit code (0 for success, non-zero for error)
     """
-    print("PROJECT_DISPLAY_NAME v0.1.0")
-    print("CLI functionality not implemented yet.")
-    return 0
+    args = _parse_args(argv)
+    run: Callable[[], int] = _run
+
+    # Instrumentation is imported only on request to keep CLI startup cheap.
+    if args.trace_out:
+        from PROJECT_NAME.utils import instrumentation
+
+        instrumentation.enable()
+
+        def traced_run() -> int:
+            with instrumentation.span("main"):
+                return _run()
+
+        run = traced_run
+
+    if args.profile:
+        import cProfile
+
+        profiler = cProfile.Profile()
+        exit_code: int = profiler.runcall(run)
+        profiler.dump_stats(args.profile)
+    else:
+        exit_code = run()
+
+    if args.trace_out:
+        instrumentation.write_chrome_trace(args.trace_out)
+    return exit_code
 
 
 if __name__ == "__main__":
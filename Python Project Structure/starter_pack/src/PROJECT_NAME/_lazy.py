@@ -0,0 +1,36 @@
+"""PEP 562 lazy exports for PROJECT_NAME packages."""
+
+import importlib
+from typing import Any, Callable
+
+
+def attach(
+    package: str, exports: dict[str, str]
+) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """Build module-level ``__getattr__`` and ``__dir__`` for lazy exports.
+
+    Each exported name is imported from its submodule on first access and
+    then cached in the package namespace, so ``import PROJECT_NAME`` stays
+    cheap no matter how large the package grows.
+
+    Args:
+        package: ``__name__`` of the package doing the exporting
+        exports: Maps each public name to the module that defines it
+
+    Returns:
+        The ``(__getattr__, __dir__)`` pair to assign in the package
+    """
+    namespace = vars(importlib.import_module(package))
+
+    def __getattr__(name: str) -> Any:
+        module = exports.get(name)
+        if module is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(module), name)
+        namespace[name] = value
+        return value
+
+    def __dir__() -> list[str]:
+        return sorted({*namespace, *exports})
+
+    return __getattr__, __dir__
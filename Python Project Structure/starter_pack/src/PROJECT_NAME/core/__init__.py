@@ -1,3 +1,16 @@
 """Core business logic for PROJECT_NAME."""
 
-__all__ = []
+from typing import TYPE_CHECKING
+
+from PROJECT_NAME._lazy import attach
+
+# Lazy exports: public name -> module defining it, imported on first access.
+_EXPORTS: dict[str, str] = {}
+
+if TYPE_CHECKING:
+    # Real imports of every _EXPORTS entry, for type checkers and tooling.
+    ...
+else:
+    __getattr__, __dir__ = attach(__name__, _EXPORTS)
+
+__all__ = [*_EXPORTS]
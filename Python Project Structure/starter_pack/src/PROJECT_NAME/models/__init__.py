@@ -1,3 +1,20 @@
 """Data models for PROJECT_NAME."""
 
-__all__ = []
+from typing import TYPE_CHECKING
+
+from PROJECT_NAME._lazy import attach
+
+# Lazy exports: public name -> module defining it, imported on first access.
+_EXPORTS: dict[str, str] = {
+    "Record": "PROJECT_NAME.models.records",
+    "RecordBatch": "PROJECT_NAME.models.records",
+}
+
+if TYPE_CHECKING:
+    # Real imports of every _EXPORTS entry, for type checkers and tooling.
+    from PROJECT_NAME.models.records import Record as Record
+    from PROJECT_NAME.models.records import RecordBatch as RecordBatch
+else:
+    __getattr__, __dir__ = attach(__name__, _EXPORTS)
+
+__all__ = [*_EXPORTS]
@@ -0,0 +1,269 @@
+"""Compact record types and a columnar batch container.
+
+Subclass :class:`Record` with annotated fields to get a ``__slots__`` class
+(no per-instance ``__dict__``) with a generated ``__init__``, ``__repr__``
+and ``__eq__``::
+
+    class Point(Record):
+        x: int
+        y: int
+        weight: float = 1.0
+
+When millions of records are needed, store them in a :class:`RecordBatch`
+instead: one ``array`` per field, so each value costs its machine size
+rather than a full Python object. Slicing a batch returns a zero-copy view
+and a whole batch converts to and from ``bytes`` in one step.
+"""
+
+from array import array
+from collections.abc import Iterable, Iterator
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    ClassVar,
+    Generic,
+    TypeVar,
+    Union,
+    overload,
+)
+
+# Field types a RecordBatch can store, with their array typecodes.
+TYPECODES: dict[Any, str] = {int: "q", float: "d", bool: "B"}
+_TYPE_NAMES = {"int": int, "float": float, "bool": bool}
+_MISSING = object()
+
+R = TypeVar("R", bound="Record")
+
+
+class _RecordMeta(type):
+    """Turn annotated class attributes into slots and a generated ``__init__``."""
+
+    def __new__(
+        mcs, name: str, bases: tuple[type, ...], namespace: dict[str, Any]
+    ) -> "_RecordMeta":
+        inherited: dict[str, Any] = {}
+        defaults: dict[str, Any] = {}
+        for base in reversed(bases):
+            inherited.update(getattr(base, "_types", {}))
+            defaults.update(getattr(base, "_defaults", {}))
+
+        own = {}
+        for field, hint in namespace.get("__annotations__", {}).items():
+            if hint is ClassVar or str(hint).startswith(
+                ("ClassVar", "typing.ClassVar")
+            ):
+                continue
+            own[field] = _TYPE_NAMES.get(hint, hint) if isinstance(hint, str) else hint
+            value = namespace.pop(field, _MISSING)
+            if value is not _MISSING:
+                defaults[field] = value
+            elif field in defaults:
+                del defaults[field]
+
+        types = {**inherited, **own}
+        fields = tuple(types)
+        seen_default = False
+        for field in fields:
+            if field in defaults:
+                seen_default = True
+            elif seen_default:
+                raise TypeError(f"non-default field {field!r} follows a default")
+
+        namespace["__slots__"] = tuple(f for f in own if f not in inherited)
+        namespace["_fields"] = fields
+        namespace["_types"] = types
+        namespace["_defaults"] = defaults
+        if fields and "__init__" not in namespace:
+            namespace["__init__"] = _make_init(fields, defaults)
+        return super().__new__(mcs, name, bases, namespace)
+
+
+def _make_init(fields: tuple[str, ...], defaults: dict[str, Any]) -> Any:
+    """Generate a positional/keyword ``__init__`` like dataclasses do."""
+    params = ", ".join(
+        f"{field}=_defaults[{field!r}]" if field in defaults else field
+        for field in fields
+    )
+    body = "\n".join(f"    self.{field} = {field}" for field in fields)
+    scope: dict[str, Any] = {"_defaults": defaults}
+    exec(f"def __init__(self, {params}):\n{body}\n", scope)  # noqa: S102
+    return scope["__init__"]
+
+
+class Record(metaclass=_RecordMeta):
+    """Base class for compact, slotted domain records."""
+
+    __slots__ = ()
+    _fields: ClassVar[tuple[str, ...]] = ()
+    _types: ClassVar[dict[str, Any]] = {}
+    _defaults: ClassVar[dict[str, Any]] = {}
+
+    if TYPE_CHECKING:
+
+        def __init__(self, *args: Any, **kwargs: Any) -> None: ...
+
+    def astuple(self) -> tuple[Any, ...]:
+        """Return the field values in declaration order."""
+        return tuple(getattr(self, field) for field in self._fields)
+
+    def __repr__(self) -> str:
+        values = ", ".join(
+            f"{field}={getattr(self, field)!r}" for field in self._fields
+        )
+        return f"{type(self).__name__}({values})"
+
+    def __eq__(self, other: object) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return bool(self.astuple() == other.astuple())  # type: ignore[attr-defined]
+
+    __hash__ = None  # type: ignore[assignment]
+
+
+class RecordBatch(Generic[R]):
+    """Columnar container holding many records of one :class:`Record` type.
+
+    Each field is stored in its own ``array`` (``int`` as signed 64-bit,
+    ``float`` as double, ``bool`` as a byte), in native byte order. Slices
+    are ``memoryview`` based and share memory with the parent batch; while
+    any view exists the parent cannot grow.
+    """
+
+    __slots__ = ("record_type", "columns")
+
+    def __init__(
+        self,
+        record_type: type[R],
+        columns: Union[dict[str, Union[array, memoryview]], None] = None,
+    ) -> None:
+        """Create a batch, empty or wrapping existing per-field columns.
+
+        Raises:
+            TypeError: If a field type has no columnar representation
+        """
+        for field, hint in record_type._types.items():
+            if hint not in TYPECODES:
+                raise TypeError(
+                    f"{record_type.__name__}.{field}: {hint!r} cannot be stored "
+                    f"in a RecordBatch (supported: int, float, bool)"
+                )
+        self.record_type = record_type
+        self.columns: dict[str, Union[array, memoryview]] = columns or {
+            field: array(TYPECODES[hint]) for field, hint in record_type._types.items()
+        }
+
+    @classmethod
+    def from_records(
+        cls, record_type: type[R], records: Iterable[R]
+    ) -> "RecordBatch[R]":
+        """Build a batch from record instances."""
+        batch = cls(record_type)
+        batch.extend(records)
+        return batch
+
+    @classmethod
+    def from_bytes(cls, record_type: type[R], data: Any) -> "RecordBatch[R]":
+        """Wrap a buffer produced by :meth:`to_bytes` without copying it.
+
+        Raises:
+            ValueError: If the buffer size is not a whole number of rows
+        """
+        view = memoryview(data).cast("B")
+        codes = [TYPECODES[hint] for hint in record_type._types.values()]
+        row_size = sum(array(code).itemsize for code in codes)
+        rows, remainder = divmod(len(view), row_size) if row_size else (0, 0)
+        if remainder:
+            raise ValueError(
+                f"{len(view)} bytes is not a multiple of the {row_size}-byte row"
+            )
+        columns: dict[str, Union[array, memoryview]] = {}
+        offset = 0
+        for field, code in zip(record_type._fields, codes):
+            size = rows * array(code).itemsize
+            columns[field] = view[offset : offset + size].cast(code)  # type: ignore[call-overload]
+            offset += size
+        return cls(record_type, columns)
+
+    def to_bytes(self) -> bytes:
+        """Return all columns back to back, in field order."""
+        return b"".join(
+            memoryview(column).tobytes() for column in self.columns.values()
+        )
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes used by the column data."""
+        return sum(memoryview(column).nbytes for column in self.columns.values())
+
+    def column(self, field: str) -> memoryview:
+        """Return a zero-copy view of one field's values."""
+        return memoryview(self.columns[field])
+
+    def append(self, record: R) -> None:
+        """Add one record to the end of the batch."""
+        self.extend((record,))
+
+    def extend(self, records: Iterable[R]) -> None:
+        """Add many records to the end of the batch.
+
+        Either every record is added or, if any value does not fit its
+        column, none are and the batch is left unchanged.
+
+        Raises:
+            TypeError: If the batch is a view or a value has the wrong type
+            OverflowError: If an ``int`` does not fit in 64 bits
+            BufferError: If a view from :meth:`column` is still held
+        """
+        records = list(records)
+        pending = {
+            field: array(
+                self._growable(column).typecode, [getattr(r, field) for r in records]
+            )
+            for field, column in self.columns.items()
+        }
+        grown: list[tuple[array, int]] = []
+        try:
+            for field, values in pending.items():
+                column = self._growable(self.columns[field])
+                size = len(column)
+                column.extend(values)
+                grown.append((column, size))
+        except BaseException:
+            # A column exported through column() cannot resize; undo the rest.
+            for column, size in grown:
+                del column[size:]
+            raise
+
+    @staticmethod
+    def _growable(column: Union[array, memoryview]) -> array:
+        if not isinstance(column, array):
+            raise TypeError("batch views and batches loaded from bytes cannot grow")
+        return column
+
+    def __len__(self) -> int:
+        for column in self.columns.values():
+            return len(column)
+        return 0
+
+    @overload
+    def __getitem__(self, index: int) -> R: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> "RecordBatch[R]": ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[R, "RecordBatch[R]"]:
+        if isinstance(index, slice):
+            columns: dict[str, Union[array, memoryview]] = {
+                field: memoryview(column)[index]
+                for field, column in self.columns.items()
+            }
+            return type(self)(self.record_type, columns)
+        values = [column[index] for column in self.columns.values()]
+        for i, hint in enumerate(self.record_type._types.values()):
+            if hint is bool:
+                values[i] = bool(values[i])
+        return self.record_type(*values)
+
+    def __iter__(self) -> Iterator[R]:
+        for i in range(len(self)):
+            yield self[i]
@@ -1,3 +1,26 @@
 """Utility functions for PROJECT_NAME."""
 
-__all__ = []
+from typing import TYPE_CHECKING
+
+from PROJECT_NAME._lazy import attach
+
+# Lazy exports: public name -> module defining it, imported on first access.
+_EXPORTS: dict[str, str] = {
+    "counted": "PROJECT_NAME.utils.instrumentation",
+    "span": "PROJECT_NAME.utils.instrumentation",
+    "timed": "PROJECT_NAME.utils.instrumentation",
+    "track_allocations": "PROJECT_NAME.utils.instrumentation",
+}
+
+if TYPE_CHECKING:
+    # Real imports of every _EXPORTS entry, for type checkers and tooling.
+    from PROJECT_NAME.utils.instrumentation import counted as counted
+    from PROJECT_NAME.utils.instrumentation import span as span
+    from PROJECT_NAME.utils.instrumentation import timed as timed
+    from PROJECT_NAME.utils.instrumentation import (
+        track_allocations as track_allocations,
+    )
+else:
+    __getattr__, __dir__ = attach(__name__, _EXPORTS)
+
+__all__ = [*_EXPORTS]
@@ -0,0 +1,252 @@
+"""Lightweight timing, call-count and allocation instrumentation.
+
+Everything here is off by default. While disabled, :func:`span` returns a
+shared no-op context manager and the decorators add a single flag check per
+call, so instrumented code can stay in production paths. Call
+:func:`enable` (or pass ``--trace-out`` to the CLI) to start recording.
+``tracemalloc`` is only imported once allocations are tracked.
+"""
+
+import functools
+import os
+import threading
+import time
+from collections import Counter
+from types import TracebackType
+from typing import Any, Callable, Optional, TypeVar, Union, cast
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+class _State:
+    """Process-wide recorder shared by every span and decorator."""
+
+    def __init__(self) -> None:
+        self.enabled = False
+        self.allocations = False
+        self.lock = threading.Lock()
+        self.events: list[dict[str, Any]] = []
+        self.totals: dict[str, list[int]] = {}
+        self.calls: Counter[str] = Counter()
+        # Open allocation spans, innermost last; see _Span.
+        self.alloc_stack: list[_Span] = []
+
+    def record(
+        self, name: str, start_ns: int, duration_ns: int, args: dict[str, int]
+    ) -> None:
+        event = {
+            "name": name,
+            "ph": "X",
+            "ts": start_ns / 1000,
+            "dur": duration_ns / 1000,
+            "pid": os.getpid(),
+            "tid": threading.get_ident(),
+        }
+        if args:
+            event["args"] = args
+        with self.lock:
+            self.events.append(event)
+            total = self.totals.setdefault(name, [0, 0])
+            total[0] += 1
+            total[1] += duration_ns
+
+
+_state = _State()
+
+
+class _Span:
+    """Times the enclosed block and optionally its memory allocations.
+
+    tracemalloc has a single global peak, so an allocation span carries the
+    peak seen so far up to its enclosing allocation span before resetting
+    it, and again on exit.
+    """
+
+    __slots__ = ("name", "track", "owns_tracing", "start_ns", "start_bytes", "peak")
+
+    def __init__(self, name: str, track: bool) -> None:
+        self.name = name
+        self.track = track
+        self.owns_tracing = False
+        self.start_ns = 0
+        self.start_bytes = 0
+        self.peak = 0
+
+    def __enter__(self) -> "_Span":
+        if self.track:
+            import tracemalloc
+
+            self.owns_tracing = not tracemalloc.is_tracing()
+            if self.owns_tracing:
+                tracemalloc.start()
+            current, peak = tracemalloc.get_traced_memory()
+            stack = _state.alloc_stack
+            if stack:
+                stack[-1].peak = max(stack[-1].peak, peak)
+            tracemalloc.reset_peak()
+            self.start_bytes = self.peak = current
+            stack.append(self)
+        self.start_ns = time.perf_counter_ns()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc: Optional[BaseException],
+        tb: Optional[TracebackType],
+    ) -> None:
+        duration_ns = time.perf_counter_ns() - self.start_ns
+        args = {}
+        if self.track:
+            import tracemalloc
+
+            current, peak = tracemalloc.get_traced_memory()
+            peak = max(self.peak, peak)
+            stack = _state.alloc_stack
+            stack.remove(self)
+            if stack:
+                stack[-1].peak = max(stack[-1].peak, peak)
+            if self.owns_tracing:
+                tracemalloc.stop()
+            args = {
+                "alloc_bytes": current - self.start_bytes,
+                "peak_bytes": peak - self.start_bytes,
+            }
+        _state.record(self.name, self.start_ns, duration_ns, args)
+
+
+class _NullSpan:
+    """Shared no-op returned by :func:`span` while instrumentation is off."""
+
+    __slots__ = ()
+
+    def __enter__(self) -> "_NullSpan":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        return None
+
+
+_NULL_SPAN = _NullSpan()
+
+
+def enable(allocations: bool = False) -> None:
+    """Start recording spans and call counts.
+
+    Args:
+        allocations: Also track net and peak allocations per span with
+            tracemalloc (noticeably slower)
+    """
+    if allocations:
+        import tracemalloc
+
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+    _state.allocations = allocations
+    _state.enabled = True
+
+
+def disable() -> None:
+    """Stop recording; data collected so far is kept until :func:`reset`."""
+    _state.enabled = False
+    if _state.allocations:
+        import tracemalloc
+
+        _state.allocations = False
+        tracemalloc.stop()
+
+
+def is_enabled() -> bool:
+    """Return True while instrumentation is recording."""
+    return _state.enabled
+
+
+def reset() -> None:
+    """Discard all recorded spans and call counts."""
+    with _state.lock:
+        _state.events.clear()
+        _state.totals.clear()
+        _state.calls.clear()
+
+
+def span(name: str) -> Union[_Span, _NullSpan]:
+    """Context manager timing the enclosed block under ``name``.
+
+    Example:
+        with span("load-config"):
+            config = load()
+    """
+    return _Span(name, _state.allocations) if _state.enabled else _NULL_SPAN
+
+
+def timed(name: Optional[str] = None) -> Callable[[F], F]:
+    """Decorator recording each call of the function as a span."""
+
+    def decorate(func: F) -> F:
+        label = name or func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if not _state.enabled:
+                return func(*args, **kwargs)
+            with _Span(label, _state.allocations):
+                return func(*args, **kwargs)
+
+        return cast(F, wrapper)
+
+    return decorate
+
+
+def counted(name: Optional[str] = None) -> Callable[[F], F]:
+    """Decorator counting calls of the function."""
+
+    def decorate(func: F) -> F:
+        label = name or func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if _state.enabled:
+                with _state.lock:
+                    _state.calls[label] += 1
+            return func(*args, **kwargs)
+
+        return cast(F, wrapper)
+
+    return decorate
+
+
+def track_allocations(name: str) -> Union[_Span, _NullSpan]:
+    """Context manager like :func:`span` that always records allocations.
+
+    Net and peak traced bytes, relative to the start of the block, are
+    attached to the span. tracemalloc is started just for the block if
+    :func:`enable` did not already start it.
+    """
+    return _Span(name, True) if _state.enabled else _NULL_SPAN
+
+
+def summary() -> dict[str, dict[str, float]]:
+    """Return per-name span counts and total seconds, plus call counts."""
+    with _state.lock:
+        result = {
+            name: {"count": count, "total_s": total_ns / 1e9}
+            for name, (count, total_ns) in _state.totals.items()
+        }
+        for name, calls in _state.calls.items():
+            result.setdefault(name, {"count": 0, "total_s": 0.0})["calls"] = calls
+    return result
+
+
+def write_chrome_trace(path: Union[str, "os.PathLike[str]"]) -> None:
+    """Write recorded spans as Chrome trace JSON (chrome://tracing, Perfetto)."""
+    import json
+
+    with _state.lock:
+        events = list(_state.events)
+        pid = os.getpid()
+        events += [
+            {"name": name, "ph": "C", "ts": 0, "pid": pid, "args": {"calls": calls}}
+            for name, calls in _state.calls.items()
+        ]
+    with open(path, "w") as f:
+        json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f)
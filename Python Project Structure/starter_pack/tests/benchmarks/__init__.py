@@ -0,0 +1,52 @@
+"""Benchmarks for PROJECT_NAME, run with ``python scripts/bench.py``.
+
+Modules named ``bench_*.py`` in this folder register callables with the
+:func:`benchmark` decorator. They are not collected by pytest.
+"""
+
+import tracemalloc
+
+REGISTRY = {}
+
+
+def benchmark(func=None, *, name=None, number=None, repeat=20, warmup=1, unit="s"):
+    """Register ``func`` as a benchmark.
+
+    Args:
+        name: Result key (defaults to ``module.function``)
+        number: Calls per sample; ``None`` calibrates to at least 0.2s
+        repeat: Number of timed samples
+        warmup: Untimed samples run first
+        unit: ``"s"`` to time calls, or ``"bytes"`` when ``func`` measures
+            memory itself and returns a byte count (see :func:`traced_bytes`)
+    """
+
+    def register(func):
+        module = func.__module__.rpartition(".")[2]
+        key = name or f"{module}.{func.__name__}"
+        REGISTRY[key] = {
+            "func": func,
+            "number": number,
+            "repeat": repeat,
+            "warmup": warmup,
+            "unit": unit,
+        }
+        return func
+
+    return register if func is None else register(func)
+
+
+def traced_bytes(build):
+    """Return the bytes still allocated after calling ``build()``.
+
+    The built object is kept alive until the measurement is taken.
+    """
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        result = build()
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    del result
+    return after - before
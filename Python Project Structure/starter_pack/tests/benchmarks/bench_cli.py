@@ -0,0 +1,24 @@
+"""CLI benchmarks for PROJECT_NAME."""
+
+import contextlib
+import io
+import subprocess
+import sys
+
+from PROJECT_NAME.__main__ import main
+from tests.benchmarks import benchmark
+
+
+@benchmark
+def main_in_process():
+    """Call the CLI entry point without process startup."""
+    with contextlib.redirect_stdout(io.StringIO()):
+        main([])
+
+
+@benchmark(number=1, repeat=15, warmup=2)
+def cli_startup():
+    """Run ``python -m PROJECT_NAME`` end to end, interpreter startup included."""
+    subprocess.run(
+        [sys.executable, "-m", "PROJECT_NAME"], check=True, stdout=subprocess.DEVNULL
+    )
@@ -0,0 +1,22 @@
+"""Overhead of PROJECT_NAME instrumentation while it is disabled."""
+
+from PROJECT_NAME.utils import instrumentation
+from tests.benchmarks import benchmark
+
+
+@instrumentation.timed()
+def _timed_noop():
+    return None
+
+
+@benchmark
+def span_disabled():
+    """Enter and exit a span with instrumentation off."""
+    with instrumentation.span("noop"):
+        pass
+
+
+@benchmark
+def timed_disabled():
+    """Call a @timed function with instrumentation off."""
+    _timed_noop()
@@ -0,0 +1,104 @@
+"""Memory and throughput of Record and RecordBatch against plain classes."""
+
+from dataclasses import dataclass
+
+from PROJECT_NAME.models import Record, RecordBatch
+from tests.benchmarks import benchmark, traced_bytes
+
+ROWS = 100_000
+
+
+class PlainPoint:
+    def __init__(self, x, y, weight):
+        self.x = x
+        self.y = y
+        self.weight = weight
+
+
+@dataclass
+class DataPoint:
+    x: int
+    y: int
+    weight: float
+
+
+class Point(Record):
+    x: int
+    y: int
+    weight: float
+
+
+def _rows():
+    return ((i, -i, i * 0.5) for i in range(1_000_000, 1_000_000 + ROWS))
+
+
+POINTS = [Point(*row) for row in _rows()]
+BATCH = RecordBatch.from_records(Point, POINTS)
+DATA = BATCH.to_bytes()
+
+
+@benchmark(unit="bytes", repeat=3)
+def memory_plain_class():
+    """Bytes held by 100k plain-class instances."""
+    return traced_bytes(lambda: [PlainPoint(*row) for row in _rows()])
+
+
+@benchmark(unit="bytes", repeat=3)
+def memory_dataclass():
+    """Bytes held by 100k dataclass instances."""
+    return traced_bytes(lambda: [DataPoint(*row) for row in _rows()])
+
+
+@benchmark(unit="bytes", repeat=3)
+def memory_record():
+    """Bytes held by 100k slotted Record instances."""
+    return traced_bytes(lambda: [Point(*row) for row in _rows()])
+
+
+@benchmark(unit="bytes", repeat=3)
+def memory_record_batch():
+    """Bytes held by a RecordBatch of 100k rows."""
+    return traced_bytes(lambda: RecordBatch.from_records(Point, POINTS))
+
+
+@benchmark(number=10_000)
+def construct_plain_class():
+    PlainPoint(1, 2, 3.0)
+
+
+@benchmark(number=10_000)
+def construct_dataclass():
+    DataPoint(1, 2, 3.0)
+
+
+@benchmark(number=10_000)
+def construct_record():
+    Point(1, 2, 3.0)
+
+
+@benchmark(repeat=5)
+def sum_field_records():
+    """Sum one field over 100k Record instances."""
+    sum(p.weight for p in POINTS)
+
+
+@benchmark(repeat=5)
+def sum_field_batch():
+    """Sum one column of a 100k-row RecordBatch."""
+    sum(BATCH.columns["weight"])
+
+
+@benchmark(number=1000)
+def slice_batch():
+    """Take a zero-copy 10k-row slice."""
+    BATCH[10_000:20_000]
+
+
+@benchmark(repeat=5)
+def batch_to_bytes():
+    BATCH.to_bytes()
+
+
+@benchmark(repeat=5)
+def batch_from_bytes():
+    RecordBatch.from_bytes(Point, DATA)
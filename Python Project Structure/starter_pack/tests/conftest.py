@@ -1,7 +1,12 @@
 """Pytest configuration and fixtures."""
 
+import importlib.util
+from pathlib import Path
+
 import pytest
 
+ROOT = Path(__file__).resolve().parents[1]
+
 
 @pytest.fixture
 def sample_data():
@@ -15,3 +20,16 @@ def temp_file(tmp_path):
     file_path = tmp_path / "test_file.txt"
     file_path.write_text("test content")
     return file_path
+
+
+@pytest.fixture
+def test_script(monkeypatch, tmp_path):
+    """Load scripts/test.py from the project root with a scratch import index."""
+    spec = importlib.util.spec_from_file_location(
+        "scripts_test", ROOT / "scripts" / "test.py"
+    )
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    monkeypatch.chdir(ROOT)
+    monkeypatch.setattr(module, "INDEX_FILE", tmp_path / "import_index.json")
+    return module
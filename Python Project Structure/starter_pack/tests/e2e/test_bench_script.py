@@ -0,0 +1,48 @@
+"""End-to-end check that scripts/bench.py runs with its CI arguments."""
+
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[2]
+
+
+def _git(cwd, *args):
+    subprocess.run(
+        ["git", "-c", "user.name=test", "-c", "user.email=test@example.com", *args],
+        cwd=cwd,
+        check=True,
+        capture_output=True,
+    )
+
+
+@pytest.mark.slow
+def test_bench_baseline_run_completes(tmp_path):
+    """bench.py --baseline REF should finish, save results and compare them."""
+    for name in ("src", "tests", "scripts"):
+        shutil.copytree(
+            ROOT / name, tmp_path / name, ignore=shutil.ignore_patterns("__pycache__")
+        )
+    _git(tmp_path, "init", "-q")
+    _git(tmp_path, "add", ".")
+    _git(tmp_path, "commit", "-q", "-m", "bench")
+
+    cmd = [
+        sys.executable,
+        "scripts/bench.py",
+        "-k",
+        "bench_cli.main_in_process",
+        "--repeat",
+        "2",
+        "--baseline",
+        "HEAD",
+    ]
+    # The first run saves results for HEAD; the second compares against them.
+    for _ in range(2):
+        result = subprocess.run(cmd, cwd=tmp_path, capture_output=True, text=True)
+        assert result.returncode in (0, 1), result.stdout + result.stderr
+        assert "Results saved" in result.stdout
+    assert "Comparing against" in result.stdout
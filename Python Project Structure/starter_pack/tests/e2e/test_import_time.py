@@ -0,0 +1,58 @@
+"""Import-time budget for the PROJECT_NAME CLI."""
+
+import os
+import subprocess
+import sys
+
+# Budget for imports triggered by ``python -m PROJECT_NAME`` on top of bare
+# interpreter startup. Override with PROJECT_NAME_IMPORT_BUDGET_MS.
+IMPORT_BUDGET_MS = float(os.environ.get("PROJECT_NAME_IMPORT_BUDGET_MS", "50"))
+# Each module's best time over several runs filters out scheduler noise.
+RUNS = 5
+
+
+def _import_times(*args):
+    """Run python -X importtime and return {module: self time in us}."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", *args],
+        check=True,
+        capture_output=True,
+        text=True,
+        env={**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)},
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, _, name = line[len("import time:") :].split("|")
+        times[name.strip()] = int(self_us)
+    return times
+
+
+def _best_import_times(*args):
+    """Return each module's minimum self time over ``RUNS`` runs."""
+    best = _import_times(*args)
+    for _ in range(RUNS - 1):
+        for name, us in _import_times(*args).items():
+            best[name] = min(best.get(name, us), us)
+    return best
+
+
+def test_cli_import_time_within_budget():
+    """python -m PROJECT_NAME should import within IMPORT_BUDGET_MS."""
+    baseline = _import_times("-c", "import runpy")
+    cli = _best_import_times("-m", "PROJECT_NAME")
+    extra = {name: us for name, us in cli.items() if name not in baseline}
+    total_ms = sum(extra.values()) / 1000
+    slowest = sorted(extra.items(), key=lambda item: item[1], reverse=True)[:5]
+    assert total_ms <= IMPORT_BUDGET_MS, (
+        f"CLI imports took {total_ms:.1f}ms (budget {IMPORT_BUDGET_MS}ms); "
+        f"slowest: {slowest}"
+    )
+
+
+def test_cli_skips_instrumentation_unless_requested():
+    """Instrumentation and tracemalloc should load only for --trace-out."""
+    plain = _import_times("-m", "PROJECT_NAME")
+    assert "PROJECT_NAME.utils.instrumentation" not in plain
+    assert "tracemalloc" not in plain
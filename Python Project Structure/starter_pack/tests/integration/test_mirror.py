@@ -0,0 +1,184 @@
+"""Integration tests for scripts/mirror.py against real git repositories."""
+
+import importlib.util
+import shutil
+import subprocess
+from pathlib import Path
+
+import pytest
+
+pytestmark = pytest.mark.integration
+
+ROOT = Path(__file__).resolve().parents[2]
+ALLOWLIST = "README.md\nLICENSE\nsrc/\n"
+QUOTED = 'src/naïve "q".py'
+
+
+@pytest.fixture(scope="module")
+def mirror():
+    spec = importlib.util.spec_from_file_location(
+        "scripts_mirror", ROOT / "scripts" / "mirror.py"
+    )
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture
+def git_env(monkeypatch):
+    """Fixed identities and dates so rewritten commit ids are reproducible."""
+    for role in ("AUTHOR", "COMMITTER"):
+        monkeypatch.setenv(f"GIT_{role}_NAME", "Test")
+        monkeypatch.setenv(f"GIT_{role}_EMAIL", "test@example.com")
+        monkeypatch.setenv(f"GIT_{role}_DATE", "2024-01-01T00:00:00+00:00")
+
+
+def _git(repo, *args):
+    return subprocess.run(
+        ["git", "-C", str(repo), *args],
+        check=True,
+        stdout=subprocess.PIPE,
+        text=True,
+    ).stdout.strip()
+
+
+def _commit(repo, message, files=(), remove=()):
+    for name, content in dict(files).items():
+        path = repo / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content)
+        _git(repo, "add", name)
+    for name in remove:
+        _git(repo, "rm", "-q", name)
+    _git(repo, "commit", "-q", "--allow-empty", "-m", message)
+
+
+def _history(repo, ref):
+    """Return {subject: [parent subjects]} for every commit reachable from ref."""
+    log = _git(repo, "log", "--format=%H %s", ref).split("\n")
+    subjects = dict(line.split(" ", 1) for line in log)
+    history = {}
+    for line in _git(repo, "log", "--format=%H %P", ref).split("\n"):
+        sha, *parents = line.split()
+        history[subjects[sha]] = [subjects[p] for p in parents]
+    return history
+
+
+def _files(repo, ref):
+    return _git(repo, "ls-tree", "-r", "-z", "--name-only", ref).strip("\0").split("\0")
+
+
+@pytest.fixture
+def source(tmp_path, git_env):
+    """A private repo with pruned commits, a no-op merge and a quoted path."""
+    repo = tmp_path / "private"
+    _git(tmp_path, "init", "-q", "-b", "main", str(repo))
+    _commit(
+        repo,
+        "init",
+        {
+            "allowlist.txt": ALLOWLIST,
+            "README.md": "hi\n",
+            "_internal/a.txt": "a\n",
+        },
+    )
+    _commit(repo, "internal only", {"_internal/b.txt": "b\n"})
+    _commit(repo, "add quoted", {QUOTED: "print()\n"})
+    _git(repo, "checkout", "-q", "-b", "feat")
+    _commit(repo, "feat internal", {"_internal/c.txt": "c\n"})
+    _git(repo, "checkout", "-q", "main")
+    _git(repo, "merge", "-q", "--no-ff", "-m", "merge feat", "feat")
+    return repo
+
+
+def _add_orphans(repo):
+    """Merge in an orphan public root, and merge main into an internal root."""
+    _git(repo, "checkout", "-q", "--orphan", "license")
+    _git(repo, "rm", "-rfq", ".")
+    _commit(repo, "license", {"LICENSE": "MIT\n"})
+    _git(repo, "checkout", "-q", "main")
+    _git(
+        repo,
+        "merge",
+        "-q",
+        "--allow-unrelated-histories",
+        "-m",
+        "merge license",
+        "license",
+    )
+    _git(repo, "checkout", "-q", "--orphan", "internal")
+    _git(repo, "rm", "-rfq", ".")
+    _commit(repo, "internal root", {"_internal/d.txt": "d\n"})
+    _git(
+        repo,
+        "merge",
+        "-q",
+        "--allow-unrelated-histories",
+        "-m",
+        "merge main",
+        "main",
+    )
+    _git(repo, "checkout", "-q", "main")
+
+
+def test_publish_prunes_internal_commits_and_quotes_paths(mirror, source, tmp_path):
+    """Internal-only commits and merges of them should disappear."""
+    state = tmp_path / "state"
+    result = mirror.publish(source, state, ["main"])
+    public = state / "public.git"
+    assert _history(public, "main") == {"add quoted": ["init"], "init": []}
+    assert _files(public, "main") == ["README.md", QUOTED]
+    assert result["kept"] == 2
+
+
+def test_incremental_publish_keeps_orphan_roots(mirror, source, tmp_path):
+    """Later runs should add only new commits, with orphan roots kept as roots."""
+    state = tmp_path / "state"
+    mirror.publish(source, state, ["main"])
+    first = _git(state / "public.git", "rev-parse", "main")
+
+    _add_orphans(source)
+    result = mirror.publish(source, state, ["main", "internal"])
+    public = state / "public.git"
+    assert result["kept"] == 2
+    assert _history(public, "main") == {
+        "merge license": ["add quoted", "license"],
+        "license": [],
+        "add quoted": ["init"],
+        "init": [],
+    }
+    assert _git(public, "rev-parse", "main^1") == first
+    assert _files(public, "main^2") == ["LICENSE"]
+    # The merge into the internal root only repeats main's public tree.
+    assert _git(public, "rev-parse", "internal") == _git(public, "rev-parse", "main")
+
+
+@pytest.mark.skipif(
+    shutil.which("git-filter-repo") is None, reason="git-filter-repo not installed"
+)
+def test_publish_matches_filter_repo(mirror, source, tmp_path):
+    """The mirror should be commit-for-commit identical to git filter-repo."""
+    _add_orphans(source)
+    state = tmp_path / "state"
+    mirror.publish(source, state, ["main", "internal"])
+
+    expected = tmp_path / "filtered"
+    shutil.copytree(source, expected)
+    allowlist = tmp_path / "paths.txt"
+    allowlist.write_text(ALLOWLIST)
+    subprocess.run(
+        [
+            "git",
+            "filter-repo",
+            "--force",
+            "--quiet",
+            "--paths-from-file",
+            str(allowlist),
+        ],
+        cwd=expected,
+        check=True,
+    )
+    for ref in ("main", "internal"):
+        assert _git(state / "public.git", "rev-parse", ref) == _git(
+            expected, "rev-parse", ref
+        )
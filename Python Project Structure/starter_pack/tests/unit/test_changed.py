@@ -0,0 +1,32 @@
+"""Unit tests for the --changed test selection in scripts/test.py."""
+
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[2]
+
+
+def test_changed_follows_lazy_exports(test_script):
+    """Tests importing a lazy export should be selected when its module changes."""
+    affected = test_script._affected_tests(["src/PROJECT_NAME/models/records.py"])
+    assert "tests/unit/test_records.py" in affected
+
+
+@pytest.mark.parametrize(
+    "path", ["pyproject.toml", "scripts/test.py", "requirements.lock", "src/x.json"]
+)
+def test_changed_untraceable_paths_run_everything(test_script, path):
+    """Changes that imports cannot explain should select the whole suite."""
+    assert test_script._affected_tests([path]) is None
+
+
+def test_changed_always_selects_e2e_tests(test_script):
+    """End-to-end tests run for every change, even documentation-only ones."""
+    e2e = sorted(
+        p.relative_to(ROOT).as_posix() for p in (ROOT / "tests/e2e").glob("test_*.py")
+    )
+    assert e2e
+    assert test_script._affected_tests(["README.md"]) == e2e
+    affected = test_script._affected_tests(["src/PROJECT_NAME/models/records.py"])
+    assert set(e2e) <= set(affected)
@@ -0,0 +1,100 @@
+"""Unit tests for PROJECT_NAME instrumentation."""
+
+import json
+import pstats
+
+import pytest
+
+from PROJECT_NAME.__main__ import main
+from PROJECT_NAME.utils import instrumentation
+
+
+@pytest.fixture(autouse=True)
+def clean_instrumentation():
+    """Start every test disabled and with no recorded data."""
+    instrumentation.disable()
+    instrumentation.reset()
+    yield
+    instrumentation.disable()
+    instrumentation.reset()
+
+
+def test_span_disabled_records_nothing():
+    """Spans should be shared no-ops while instrumentation is off."""
+    assert instrumentation.span("a") is instrumentation.span("b")
+    with instrumentation.span("a"):
+        pass
+    assert instrumentation.summary() == {}
+
+
+def test_span_enabled_records_count_and_time():
+    """Enabled spans should aggregate per name."""
+    instrumentation.enable()
+    for _ in range(3):
+        with instrumentation.span("work"):
+            pass
+    stats = instrumentation.summary()["work"]
+    assert stats["count"] == 3
+    assert stats["total_s"] >= 0
+
+
+def test_timed_and_counted_decorators_record_calls():
+    """Decorators should record spans and call counts only when enabled."""
+
+    @instrumentation.counted("calls")
+    @instrumentation.timed("timed")
+    def double(x):
+        return x * 2
+
+    assert double(2) == 4
+    assert instrumentation.summary() == {}
+
+    instrumentation.enable()
+    assert double(3) == 6
+    stats = instrumentation.summary()
+    assert stats["timed"]["count"] == 1
+    assert stats["calls"]["calls"] == 1
+
+
+def test_track_allocations_reports_bytes(tmp_path):
+    """Allocation spans should attach net and peak traced bytes."""
+    instrumentation.enable()
+    with instrumentation.track_allocations("alloc"):
+        data = [0] * 100_000
+    trace_file = tmp_path / "trace.json"
+    instrumentation.write_chrome_trace(trace_file)
+    (event,) = json.loads(trace_file.read_text())["traceEvents"]
+    assert event["name"] == "alloc"
+    assert event["args"]["peak_bytes"] >= len(data) * 8
+
+
+def test_nested_allocation_spans_keep_outer_peak(tmp_path):
+    """An inner allocation span should not reset the outer span's peak."""
+    instrumentation.enable()
+    with instrumentation.track_allocations("outer"):
+        data = bytearray(8_000_000)
+        del data
+        with instrumentation.track_allocations("inner"):
+            small = [0] * 1000
+    trace_file = tmp_path / "trace.json"
+    instrumentation.write_chrome_trace(trace_file)
+    events = json.loads(trace_file.read_text())["traceEvents"]
+    peaks = {event["name"]: event["args"]["peak_bytes"] for event in events}
+    assert peaks["outer"] >= 8_000_000
+    assert len(small) * 8 <= peaks["inner"] < 1_000_000
+
+
+def test_cli_trace_out_writes_chrome_trace(tmp_path, capsys):
+    """--trace-out should write a Chrome trace containing the main span."""
+    trace_file = tmp_path / "trace.json"
+    assert main(["--trace-out", str(trace_file)]) == 0
+    events = json.loads(trace_file.read_text())["traceEvents"]
+    assert [event["name"] for event in events] == ["main"]
+    assert events[0]["ph"] == "X"
+
+
+def test_cli_profile_writes_pstats(tmp_path, capsys):
+    """--profile should write stats loadable by pstats."""
+    profile_file = tmp_path / "cli.prof"
+    assert main(["--profile", str(profile_file)]) == 0
+    assert pstats.Stats(str(profile_file)).total_calls > 0
@@ -0,0 +1,79 @@
+"""Unit tests for PROJECT_NAME lazy exports."""
+
+import ast
+import importlib
+import json
+import os
+import subprocess
+import sys
+import types
+from pathlib import Path
+
+import pytest
+
+from PROJECT_NAME._lazy import attach
+
+
+@pytest.fixture
+def lazy_package(monkeypatch):
+    """Provide a throwaway package that lazily exports json.dumps."""
+    package = types.ModuleType("lazy_pkg")
+    monkeypatch.setitem(sys.modules, "lazy_pkg", package)
+    package.__getattr__, package.__dir__ = attach("lazy_pkg", {"dumps": "json"})
+    return package
+
+
+def test_lazy_export_first_access_resolves_and_caches(lazy_package):
+    """Exports should be imported on first access and then cached."""
+    assert "dumps" not in vars(lazy_package)
+    assert lazy_package.dumps is json.dumps
+    assert vars(lazy_package)["dumps"] is json.dumps
+
+
+def test_lazy_export_unknown_name_raises_attribute_error(lazy_package):
+    """Names that are not exported should behave like missing attributes."""
+    with pytest.raises(AttributeError, match="missing"):
+        lazy_package.missing  # noqa: B018
+
+
+def test_lazy_export_dir_lists_unresolved_names(lazy_package):
+    """dir() should advertise exports before they are resolved."""
+    assert "dumps" in dir(lazy_package)
+
+
+def test_package_import_leaves_subpackages_unloaded():
+    """Importing the package should not import core, models or utils."""
+    code = (
+        "import sys, PROJECT_NAME; "
+        "print(sorted(m for m in sys.modules if m.startswith('PROJECT_NAME.')))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        check=True,
+        capture_output=True,
+        text=True,
+        env={**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)},
+    )
+    assert result.stdout.strip() == "['PROJECT_NAME._lazy']"
+
+
+@pytest.mark.parametrize(
+    "package",
+    ["PROJECT_NAME", "PROJECT_NAME.core", "PROJECT_NAME.models", "PROJECT_NAME.utils"],
+)
+def test_lazy_exports_mirrored_by_type_checking_imports(package):
+    """Every _EXPORTS entry should have a matching TYPE_CHECKING import."""
+    module = importlib.import_module(package)
+    tree = ast.parse(Path(module.__file__).read_text())
+    (block,) = [
+        node
+        for node in tree.body
+        if isinstance(node, ast.If) and ast.unparse(node.test) == "TYPE_CHECKING"
+    ]
+    imported = {
+        alias.asname or alias.name: node.module
+        for node in block.body
+        if isinstance(node, ast.ImportFrom)
+        for alias in node.names
+    }
+    assert imported == module._EXPORTS
@@ -0,0 +1,113 @@
+"""Unit tests for PROJECT_NAME compact records."""
+
+import pytest
+
+from PROJECT_NAME.models import Record, RecordBatch
+
+
+class Point(Record):
+    x: int
+    y: int
+    weight: float = 1.0
+    active: bool = True
+
+
+class Tagged(Record):
+    name: str
+
+
+def _batch(rows=10):
+    return RecordBatch.from_records(
+        Point, [Point(i, -i, i / 2, i % 2 == 0) for i in range(rows)]
+    )
+
+
+def test_record_is_slotted_with_generated_methods():
+    """Records should have no __dict__ and compare by field values."""
+    point = Point(1, 2)
+    assert not hasattr(point, "__dict__")
+    assert Point.__slots__ == ("x", "y", "weight", "active")
+    assert point == Point(x=1, y=2, weight=1.0, active=True)
+    assert point != Point(1, 3)
+    assert repr(point) == "Point(x=1, y=2, weight=1.0, active=True)"
+    with pytest.raises(AttributeError):
+        point.z = 3  # type: ignore[attr-defined]
+
+
+def test_record_rejects_required_field_after_default():
+    """Field ordering rules should match dataclasses."""
+    with pytest.raises(TypeError, match="follows a default"):
+
+        class Bad(Record):
+            x: int = 0
+            y: int
+
+
+def test_batch_round_trips_records():
+    """Records read back from a batch should equal the originals."""
+    batch = _batch()
+    assert len(batch) == 10
+    assert batch[3] == Point(3, -3, 1.5, False)
+    assert list(batch)[-1] == Point(9, -9, 4.5, False)
+    assert batch.nbytes == 10 * (8 + 8 + 8 + 1)
+
+
+def test_batch_slice_is_zero_copy_view():
+    """Slices should share memory with the parent batch."""
+    batch = _batch()
+    view = batch[2:5]
+    assert [p.x for p in view] == [2, 3, 4]
+    batch.columns["x"][3] = 99
+    assert view[1].x == 99
+    with pytest.raises(TypeError, match="cannot grow"):
+        view.append(Point(0, 0))
+
+
+def test_batch_bytes_round_trip():
+    """to_bytes/from_bytes should preserve every row."""
+    batch = _batch()
+    loaded = RecordBatch.from_bytes(Point, batch.to_bytes())
+    assert list(loaded) == list(batch)
+    with pytest.raises(ValueError, match="multiple"):
+        RecordBatch.from_bytes(Point, batch.to_bytes()[:-1])
+
+
+def test_batch_rejects_unsupported_field_types():
+    """Only int, float and bool fields can be stored in columns."""
+    with pytest.raises(TypeError, match="cannot be stored"):
+        RecordBatch(Tagged)
+
+
+def test_batch_bytes_of_stepped_slice():
+    """Non-contiguous slices should still serialise row for row."""
+    batch = _batch()
+    loaded = RecordBatch.from_bytes(Point, batch[::2].to_bytes())
+    assert list(loaded) == list(batch)[::2]
+
+
+@pytest.mark.parametrize(
+    ("bad", "error"),
+    [(Point(1, 2, "heavy"), TypeError), (Point(2**70, 2), OverflowError)],
+)
+def test_batch_growth_is_atomic(bad, error):
+    """A value that does not fit its column should leave the batch unchanged."""
+    batch = _batch(3)
+    before = batch.to_bytes()
+    with pytest.raises(error):
+        batch.append(bad)
+    with pytest.raises(error):
+        batch.extend([Point(7, 7), bad])
+    assert len(batch) == 3
+    assert batch.to_bytes() == before
+
+
+def test_batch_growth_rolls_back_when_a_column_is_exported():
+    """Columns grown before a locked one should be trimmed back."""
+    batch = _batch(3)
+    weights = batch.column("weight")
+    with pytest.raises(BufferError):
+        batch.append(Point(3, 3))
+    assert {len(column) for column in batch.columns.values()} == {3}
+    weights.release()
+    batch.append(Point(3, 3))
+    assert batch[3] == Point(3, 3)
@@ -0,0 +1,75 @@
+"""Unit tests for the --jobs sharding helpers in scripts/test.py."""
+
+import xml.etree.ElementTree as ET
+
+import pytest
+
+
+def test_balance_assigns_longest_files_first(test_script):
+    """Each file should go to the least loaded shard, slowest files first."""
+    durations = {
+        "tests/a.py::test_1": 1.0,
+        "tests/a.py::test_2": 2.0,
+        "tests/b.py::test": 2.0,
+        "tests/c.py::test": 2.0,
+        "tests/d.py::test": 1.0,
+    }
+    files = ["tests/d.py", "tests/c.py", "tests/b.py", "tests/a.py"]
+    shards = test_script._balance(files, durations, 2)
+    assert shards == [["tests/a.py", "tests/d.py"], ["tests/c.py", "tests/b.py"]]
+
+
+def test_balance_gives_untimed_files_the_mean_weight(test_script):
+    """Files without history should count as an average file, not as free."""
+    durations = {"tests/a.py::test_1": 1.0, "tests/a.py::test_2": 3.0}
+    files = ["tests/a.py", "tests/new_1.py", "tests/new_2.py"]
+    shards = test_script._balance(files, durations, 2)
+    assert shards == [["tests/a.py", "tests/new_2.py"], ["tests/new_1.py"]]
+    # With no history at all every file weighs the same.
+    assert test_script._balance(files, {}, 3) == [[f] for f in files]
+
+
+def test_balance_never_creates_empty_shards(test_script):
+    """More jobs than files should give one shard per file."""
+    assert test_script._balance(["tests/a.py", "tests/b.py"], {}, 8) == [
+        ["tests/a.py"],
+        ["tests/b.py"],
+    ]
+
+
+@pytest.mark.parametrize(
+    ("classname", "name", "nodeid"),
+    [
+        ("tests.unit.test_x", "test_plain", "tests/unit/test_x.py::test_plain"),
+        (
+            "tests.unit.test_x.TestGroup",
+            "test_method",
+            "tests/unit/test_x.py::TestGroup::test_method",
+        ),
+        (
+            "tests.unit.test_x",
+            "test_param[a.b-1]",
+            "tests/unit/test_x.py::test_param[a.b-1]",
+        ),
+        ("tests.unit.test_gone", "test_plain", None),
+    ],
+)
+def test_junit_nodeid(test_script, classname, name, nodeid):
+    """JUnit testcases should map back to the node ids pytest reports."""
+    case = ET.Element("testcase", classname=classname, name=name)
+    assert test_script._junit_nodeid(case, {"tests/unit/test_x.py"}) == nodeid
+
+
+def test_short_summary_is_kept_for_passing_shards(test_script):
+    """Skip and xfail reasons should be extracted from a passing shard."""
+    output = (
+        "..s\n"
+        "=== short test summary info ===\n"
+        "SKIPPED [1] tests/unit/test_x.py:3: no network\n"
+        "2 passed, 1 skipped in 0.01s\n"
+    )
+    assert test_script._short_summary(output) == (
+        "=== short test summary info ===\n"
+        "SKIPPED [1] tests/unit/test_x.py:3: no network"
+    )
+    assert test_script._short_summary("...\n3 passed in 0.01s\n") == ""